@@ -50,6 +50,9 @@ setup(
         'QuantLib-Python>=1.18',
     ],
     extras_require={
+        'numba': [
+            'numba>=0.57.0',
+        ],
         'dev': [
             'pytest>=6.0.0',
             'pytest-cov>=2.10.0',
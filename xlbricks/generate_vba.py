@@ -0,0 +1,178 @@
+"""
+    Author: julij.jegorov
+    Date: 15/02/2026
+    Description: Adds a VBA-side result cache to an exported xlwings UDF module (.bas) for the
+                 xlb_* functions marked with xlb_cached, so repeated calls skip the trip to Python.
+"""
+
+import argparse
+import re
+
+# Wrappers that empty the VBA cache before calling Python
+_CLEAR_FUNCTIONS = ('xlb_clear_bricks_front',)
+
+# Wrapper returning the Python server's session token; a new token (server restart) empties the cache
+_SESSION_FUNCTION = 'xlb_session'
+
+# Cached results kept before the VBA cache is emptied
+_CACHE_SIZE = 4096
+
+_PATCH_MARKER = "' XLBricks result cache"
+
+_FUNCTION_RE = re.compile(r'^(\s*)(?:Public\s+)?Function\s+(\w+)\((.*)\)\s*$')
+_PROCEDURE_RE = re.compile(r'^\s*(?:Public\s+|Private\s+)?(?:Function|Sub)\s+\w+')
+_END_FUNCTION_RE = re.compile(r'^\s*End\s+Function\s*$')
+
+_CACHE_HELPERS = '''%s
+Private Const XLB_CACHE_SIZE As Long = %d
+Private xlbCache As Object
+Private xlbSession As String
+Private xlbSessionCheckedAt As Single
+
+Private Sub XLBCacheCheckSession()
+    ' Brick counters restart with the Python server, so results cached before a restart are stale.
+    ' The token is asked for at most once a second to keep recalculation bursts off Python.
+    Dim session As Variant
+    If xlbSession <> "" And Abs(Timer - xlbSessionCheckedAt) < 1 Then Exit Sub
+    session = %s()
+    xlbSessionCheckedAt = Timer
+    If IsError(session) Or IsArray(session) Then
+        xlbSession = ""
+        Set xlbCache = Nothing
+    ElseIf CStr(session) <> xlbSession Then
+        xlbSession = CStr(session)
+        Set xlbCache = Nothing
+    End If
+End Sub
+
+Private Function XLBCacheKey(fname As String, args As Variant) As String
+    ' Returns "" (not cacheable) unless every argument is a single cell or a plain value
+    Dim arg As Variant, value As Variant, key As String
+    key = fname
+    For Each arg In args
+        If IsObject(arg) Then
+            If Not TypeOf arg Is Range Then Exit Function
+            If arg.Cells.CountLarge <> 1 Then Exit Function
+            value = arg.Value
+        Else
+            value = arg
+        End If
+        If IsMissing(value) Then
+            key = key & "|~"
+        ElseIf IsArray(value) Or IsError(value) Or IsObject(value) Then
+            Exit Function
+        Else
+            key = key & "|" & TypeName(value) & ":" & CStr(value)
+        End If
+    Next arg
+    XLBCacheKey = key
+End Function
+
+Private Function XLBCacheHas(key As String) As Boolean
+    If key = "" Then Exit Function
+    XLBCacheCheckSession
+    If xlbCache Is Nothing Then Set xlbCache = CreateObject("Scripting.Dictionary")
+    XLBCacheHas = xlbCache.Exists(key)
+End Function
+
+Private Sub XLBCacheStore(key As String, result As Variant)
+    If key = "" Then Exit Sub
+    If Not (IsArray(result) Or IsObject(result) Or IsError(result) Or IsNull(result)) Then
+        If Left$(CStr(result), Len("#XLB ERROR")) = "#XLB ERROR" Then Exit Sub
+    End If
+    If xlbCache Is Nothing Then Set xlbCache = CreateObject("Scripting.Dictionary")
+    If xlbCache.Count >= XLB_CACHE_SIZE Then xlbCache.RemoveAll
+    xlbCache(key) = result
+End Sub
+
+''' % (_PATCH_MARKER, _CACHE_SIZE, _SESSION_FUNCTION)
+
+
+def cached_function_names(module=None):
+    """Return the names of the UDFs marked with xlb_cached.
+    
+    Defaults to the xlbfunctions module.
+    """
+    if module is None:
+        import xlbricks.xlbfunctions as module
+    return sorted(name for name in dir(module) if getattr(getattr(module, name), '__xlb_cached__', False))
+
+
+def patch_vba(source, cached, clear=_CLEAR_FUNCTIONS):
+    """Add the result cache to the wrappers of an exported xlwings UDF module.
+    
+    Wrappers named in cached look up and store their result; wrappers named in clear empty the cache.
+    """
+    if _PATCH_MARKER in source:
+        raise ValueError('VBA module is already patched')
+    if not re.search(r'^\s*(?:Public\s+)?Function\s+%s\(' % _SESSION_FUNCTION, source, re.MULTILINE):
+        raise ValueError('VBA module has no %s wrapper; re-import the xlwings UDFs' % _SESSION_FUNCTION)
+    cached = frozenset(cached)
+    clear = frozenset(clear)
+
+    lines = source.splitlines()
+    out = list()
+    helpers_added = False
+    fname = None
+    for line in lines:
+        if not helpers_added and _PROCEDURE_RE.match(line):
+            out.extend(_CACHE_HELPERS.splitlines())
+            helpers_added = True
+
+        match = _FUNCTION_RE.match(line)
+        if match:
+            indent, fname, params = match.groups()
+            out.append(line)
+            body = indent + '    '
+            if fname in clear:
+                out.append(body + 'Set xlbCache = Nothing')
+            if fname in cached:
+                args = ', '.join(_param_name(p) for p in params.split(',') if p.strip())
+                out.extend((
+                    body + 'Dim xlbKey As String, xlbResult As Variant',
+                    body + 'xlbKey = XLBCacheKey("%s", Array(%s))' % (fname, args),
+                    body + 'If XLBCacheHas(xlbKey) Then',
+                    body + '    %s = xlbCache(xlbKey)' % fname,
+                    body + '    Exit Function',
+                    body + 'End If',
+                ))
+            continue
+
+        if fname in cached:
+            call = re.match(r'^(\s*)%s = (\w+\.CallUDF\(.*\))\s*$' % re.escape(fname), line)
+            if call:
+                indent, expr = call.groups()
+                out.extend((
+                    indent + 'xlbResult = ' + expr,
+                    indent + 'XLBCacheStore xlbKey, xlbResult',
+                    indent + '%s = xlbResult' % fname,
+                ))
+                continue
+        if _END_FUNCTION_RE.match(line):
+            fname = None
+        out.append(line)
+
+    return '\r\n'.join(out) + '\r\n'
+
+
+def _param_name(param):
+    """Strip Optional/ParamArray and array brackets from a VBA parameter declaration."""
+    name = param.split()[-1]
+    return name[:-2] if name.endswith('()') else name
+
+
+def main(argv=None):
+    """Command line entry: patch an exported xlwings_udfs .bas file."""
+    parser = argparse.ArgumentParser(description='Add a VBA result cache to xlb_cached UDF wrappers.')
+    parser.add_argument('source', help='exported xlwings UDF module (.bas)')
+    parser.add_argument('target', help='path of the patched module to write')
+    args = parser.parse_args(argv)
+
+    with open(args.source, encoding='cp1252') as f:
+        source = f.read()
+    with open(args.target, 'w', encoding='cp1252', newline='') as f:
+        f.write(patch_vba(source, cached_function_names()))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,12 +5,18 @@
                  and XLBricksUtils; bridges Excel ranges to brick structures.
 """
 
+import functools
 import numpy as np
-import pandas as pd
 from xlbricks.libs.xlbricks import XLBrick, XLBricks
 from xlbricks.libs.xlbricks_front import XLBricksFront
 from xlbricks.libs.xlbricks_frontstack import XLBricksFrontStack, add_bricks_to_front_stack, delete_bricks_from_front_stack
 
+# Ranges above this many cells are cropped with the compiled kernel (when numba is installed)
+_CROP_NUMBA_THRESHOLD = 10000
+
+# numba-compiled _crop_bounds_f64_py; built on the first large crop (False when numba is not installed)
+_CROP_KERNEL = None
+
 
 class XLBricksFunction(object):
     """Decorator that wraps functions to automatically manage brick storage and references.
@@ -30,9 +36,12 @@ class XLBricksFunction(object):
         
         Wraps the function to add results to the front stack and return references.
         """
+        is_dynamic = self.is_dynamic
+
+        @functools.wraps(f)
         def wrap(*args, **kwargs):
             xl_output = f(*args, **kwargs)
-            if self.is_dynamic and not isinstance(xl_output, XLBricksFront):
+            if is_dynamic and not isinstance(xl_output, XLBricksFront):
                 return xl_output
 
             add_bricks_to_front_stack(xl_output)
@@ -52,11 +61,10 @@ class XLUtils(object):
         
         Expects a 1x1 cell containing 'alias:counter' format.
         """
-        if XLUtils.is_bricks_front_name(data):
-            key = ''.join(data[0, 0].split(':')[:-1])
-            return XLBricksFrontStack()[key]
-        else:
+        key = XLUtils._parse_front(data)
+        if key is None:
             return None
+        return XLBricksFrontStack()[key]
 
     @staticmethod
     def get_bricks(data):
@@ -68,22 +76,59 @@ class XLUtils(object):
         bricks_front = XLUtils.get_bricks_front(data)
         if bricks_front is None:
             if data.dtype.type is np.str_:
-                df = pd.DataFrame(data)
-                numeric = df.apply(pd.to_numeric, errors='coerce')
-                data = numeric.where(numeric.notna(), df).values
+                data = XLUtils._str_to_numeric(data)
             return XLBrick(None, data)
         else:
             delete_bricks_from_front_stack(bricks_front)
             return bricks_front.xlbricks
 
+    @staticmethod
+    def get_bricks_batch(items):
+        """Convert several Excel ranges into bricks in one pass.
+        
+        Returns a list aligned with items (None stays None); a brick reference passed more than once is resolved once.
+        """
+        resolved = dict()
+        bricks = list()
+        for data in items:
+            if data is None:
+                bricks.append(None)
+                continue
+            key = XLUtils._parse_front(data)
+            memo_key = id(data) if key is None else key
+            brick = resolved.get(memo_key)
+            if brick is None:
+                brick = resolved[memo_key] = XLUtils.get_bricks(data)
+            bricks.append(brick)
+        return bricks
+
+    @staticmethod
+    def _str_to_numeric(data):
+        """Convert numeric-looking cells of a string range to floats.
+        
+        Parses the whole range in one go when every cell parses; otherwise converts column by column and keeps text cells.
+        Both paths use pd.to_numeric, so a cell converts the same way whatever its neighbours hold.
+        """
+        import pandas as pd
+        numeric = pd.to_numeric(data.ravel(), errors='coerce')
+        if not np.isnan(numeric).any():
+            return numeric.astype(np.float64).reshape(data.shape)
+
+        out = data.astype(object)
+        for idx in range(data.shape[1]):
+            numeric = pd.to_numeric(data[:, idx], errors='coerce')
+            filled = ~np.isnan(numeric)
+            out[filled, idx] = numeric[filled]
+        return out
+
     @staticmethod
     def delete_bricks(data):
         """Delete a brick from memory using its reference.
         
         Expects a 1x1 cell containing the brick reference to remove.
         """
-        if XLUtils.is_bricks_front_name(data):
-            key = ''.join(data[0, 0].split(':')[:-1])
+        key = XLUtils._parse_front(data)
+        if key is not None:
             del XLBricksFrontStack()[key]
 
     @staticmethod
@@ -92,10 +137,20 @@ class XLUtils(object):
         
         Returns True if it's a 1x1 cell with a colon-separated reference.
         """
-        if data.shape == (1, 1) and isinstance(data[0, 0], str) and ':' in data[0, 0]:
-            return True
-        else:
-            return False
+        return XLUtils._parse_front(data) is not None
+
+    @staticmethod
+    def _parse_front(data):
+        """Extract the front stack key from a brick reference cell.
+        
+        Returns the 'alias' part of a 1x1 'alias:counter' cell, or None if data is not a reference.
+        """
+        if data.shape != (1, 1):
+            return None
+        value = data[0, 0]
+        if isinstance(value, str) and ':' in value:
+            return value.rsplit(':', 1)[0]
+        return None
 
     @staticmethod
     def crop_range(data):
@@ -106,35 +161,30 @@ class XLUtils(object):
         if data.dtype.type is np.str_:
             return XLUtils._crop_range(data, lambda x: x == 'nan')
         elif data.dtype.type is np.object_:
-            return XLUtils._crop_range(data, lambda x: pd.isnull(x))
-        else:
-            return XLUtils._crop_range(data, lambda x: np.isnan(x))
+            import pandas as pd
+            return XLUtils._crop_range(data, pd.isnull)
+        if data.dtype == np.float64 and data.size > _CROP_NUMBA_THRESHOLD:
+            kernel = _crop_kernel()
+            if kernel is not None:
+                r0, r1, c0, c1 = kernel(data)
+                if r1 < r0:
+                    return data[:0, :0]
+                return data[r0:r1 + 1, c0:c1 + 1]
+        return XLUtils._crop_range(data, lambda x: np.isnan(x))
 
     @staticmethod
     def _crop_range(data, func_isnan):
         """Internal helper to crop range using a custom empty-cell detection function.
-        
-        Removes empty rows and columns from all four edges.
-        """
-        while func_isnan(data[0, :]).all():
-            data = np.delete(data, 0, axis=0)
-
-        while func_isnan(data[:, 0]).all():
-            data = np.delete(data, 0, axis=1)
 
-        rows, cols = data.shape
-        row_idx = rows - 1
-        while row_idx > 0 and func_isnan(data[row_idx, :]).all():
-            data = np.delete(data, row_idx, axis=0)
-            row_idx -= 1
-
-        rows, cols = data.shape
-        col_idx = cols - 1
-        while col_idx > 0 and func_isnan(data[:, col_idx]).all():
-            data = np.delete(data, col_idx, axis=1)
-            col_idx -= 1
+        Builds the empty-cell mask once and slices the non-empty bounding box from all four edges.
+        """
+        filled = ~np.asarray(func_isnan(data), dtype=bool)
+        rows_idx = np.flatnonzero(filled.any(axis=1))
+        if rows_idx.size == 0:
+            return data[:0, :0]
 
-        return data
+        cols_idx = np.flatnonzero(filled.any(axis=0))
+        return data[rows_idx[0]:rows_idx[-1] + 1, cols_idx[0]:cols_idx[-1] + 1]
 
     @staticmethod
     def active_cell_address(xl_app):
@@ -149,6 +199,77 @@ class XLUtils(object):
         return address
 
 
+def _crop_bounds_f64_py(arr):
+    """Find the (r0, r1, c0, c1) bounds of non-NaN cells in a float64 2D array.
+    
+    Walks each edge inwards and stops at the first filled cell; returns r1 < r0 if all cells are NaN.
+    """
+    rows, cols = arr.shape
+    r0 = 0
+    while r0 < rows:
+        filled = False
+        for c in range(cols):
+            if not np.isnan(arr[r0, c]):
+                filled = True
+                break
+        if filled:
+            break
+        r0 += 1
+    if r0 == rows:
+        return 0, -1, 0, -1
+
+    r1 = rows - 1
+    while r1 > r0:
+        filled = False
+        for c in range(cols):
+            if not np.isnan(arr[r1, c]):
+                filled = True
+                break
+        if filled:
+            break
+        r1 -= 1
+
+    c0 = 0
+    while c0 < cols:
+        filled = False
+        for r in range(r0, r1 + 1):
+            if not np.isnan(arr[r, c0]):
+                filled = True
+                break
+        if filled:
+            break
+        c0 += 1
+
+    c1 = cols - 1
+    while c1 > c0:
+        filled = False
+        for r in range(r0, r1 + 1):
+            if not np.isnan(arr[r, c1]):
+                filled = True
+                break
+        if filled:
+            break
+        c1 -= 1
+
+    return r0, r1, c0, c1
+
+
+def _crop_kernel():
+    """Return the compiled crop kernel, or None without numba.
+    
+    numba is imported on the first call only, keeping it off the UDF import path.
+    """
+    global _CROP_KERNEL
+    if _CROP_KERNEL is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _CROP_KERNEL = False
+        else:
+            _CROP_KERNEL = njit(cache=True)(_crop_bounds_f64_py)
+    return _CROP_KERNEL or None
+
+
 class XLBricksUtils(object):
     """Utilities for converting Python data structures into brick objects.
     
@@ -162,14 +283,10 @@ class XLBricksUtils(object):
         Each key-value pair becomes a brick, with nested dicts creating sub-bricks.
         """
 
-        qd_element = XLBricks()
-        for key, data in input_data.items():
-            if isinstance(data, dict):
-                qd_element[key] = XLBricksUtils.element_from_dictionary(data)
-            else:
-                qd_element[key] = XLBricks(None, data)
-
-        return qd_element
+        return XLBricks(None, {
+            key: XLBricksUtils.element_from_dictionary(data) if isinstance(data, dict) else XLBrick(None, data)
+            for key, data in input_data.items()
+        })
 
     @staticmethod
     def element_from_list(input_data, key_prefix):
@@ -178,9 +295,5 @@ class XLBricksUtils(object):
         Creates bricks with keys like 'prefix_1', 'prefix_2', etc.
         """
 
-        qd_element = XLBricks()
-        for idx, res in enumerate(input_data, 1):
-            qd_element['%s_%s' % (key_prefix, idx)] = XLBricks(None, res)
-
-        return qd_element
+        return XLBricks(None, {f'{key_prefix}_{idx}': XLBrick(None, res) for idx, res in enumerate(input_data, 1)})
 
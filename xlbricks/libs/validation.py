@@ -1,14 +1,21 @@
 """
     Author: julij.jegorov
     Date: 15/02/2026
-    Description: Validation helpers for UDF inputs: _is_missing, _check_required, _check_array_2d.
-                 Used by xlbfunctions; no heavy deps (numpy only) so tests can run without PyQt/QuantLib.
+    Description: Validation helpers for UDF inputs: _is_missing, _check_required, _check_array_2d, _validate.
+                 Used by xlbfunctions; no heavy deps (numpy, numba optional) so tests can run without PyQt/QuantLib.
 """
 
 import numpy as np
 
 _ERROR_PREFIX = '#XLB ERROR: '
 
+# numba-compiled _any_non_nan_py; built on first use (False when numba is not installed)
+_ANY_NON_NAN_KERNEL = None
+
+# Check kinds for _validate specs
+_REQUIRED = 'required'
+_ARRAY_2D = 'array2d'
+
 
 def _is_missing(val):
     """Check if a value is missing, empty, or invalid.
@@ -22,17 +29,50 @@ def _is_missing(val):
     if isinstance(val, str) and (not val.strip() or val.strip().lower() == 'nan'):
         return True
     if hasattr(val, 'shape'):
+        # pandas objects have no .flat; work on the underlying array
+        val = np.asarray(val)
         if val.size == 0:
             return True
-        if getattr(val, 'dtype', None) is not None and np.issubdtype(val.dtype, np.floating):
-            try:
-                if np.all(np.isnan(val)):
-                    return True
-            except (TypeError, ValueError):
-                pass
+        if val.dtype.kind == 'f':
+            # A filled first cell settles the common case without scanning the whole array
+            if not np.isnan(val.flat[0]):
+                return False
+            # The compiled kernel only has float32/float64 loops (numba rejects float16)
+            if val.dtype.type in (np.float64, np.float32):
+                kernel = _any_non_nan_kernel()
+                if kernel is not None:
+                    return not kernel(val.ravel())
+            return bool(np.isnan(val).all())
     return False
 
 
+def _any_non_nan_py(arr):
+    """Check whether a 1D float array holds at least one non-NaN value.
+    
+    Stops at the first filled cell instead of building a full NaN mask.
+    """
+    for x in arr:
+        if not np.isnan(x):
+            return True
+    return False
+
+
+def _any_non_nan_kernel():
+    """Return the compiled _any_non_nan_py, or None without numba.
+    
+    numba is imported on the first call only, so importing this module stays cheap.
+    """
+    global _ANY_NON_NAN_KERNEL
+    if _ANY_NON_NAN_KERNEL is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _ANY_NON_NAN_KERNEL = False
+        else:
+            _ANY_NON_NAN_KERNEL = njit(cache=True)(_any_non_nan_py)
+    return _ANY_NON_NAN_KERNEL or None
+
+
 def _check_required(name, val, allow_none=False):
     """Validate that a required parameter has a value.
     
@@ -50,6 +90,10 @@ def _check_array_2d(name, val, required=True):
     
     Returns an error message if invalid, otherwise None.
     """
+    # xw.arg(..., ndim=2) already hands UDFs a 2D ndarray, so check that case first. This stays in Python:
+    # a jitted check costs more in dispatch than these attribute reads and cannot take object arrays.
+    if val.__class__ is np.ndarray and val.ndim == 2 and val.size:
+        return None
     if val is None and not required:
         return None
     if val is None:
@@ -59,3 +103,19 @@ def _check_array_2d(name, val, required=True):
     if val.size == 0:
         return _ERROR_PREFIX + '%s cannot be empty.' % name
     return None
+
+
+def _validate(*specs):
+    """Validate several UDF inputs in one pass.
+    
+    Each spec is (name, kind, value) with kind _REQUIRED or _ARRAY_2D; returns the first error message, otherwise None.
+    """
+    for name, kind, val in specs:
+        # The helpers check the common valid inputs first, so the rules live in one place
+        if kind == _ARRAY_2D:
+            err = _check_array_2d(name, val)
+        else:
+            err = _check_required(name, val)
+        if err:
+            return err
+    return None
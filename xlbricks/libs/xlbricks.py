@@ -7,9 +7,10 @@
 
 import abc
 import numpy as np
-import QuantLib as ql
 from datetime import datetime
-from collections import OrderedDict
+from functools import lru_cache
+
+_BOOL_MAP = {'true': True, 'false': False}
 
 
 class XLBrickAbstract(metaclass=abc.ABCMeta):
@@ -18,6 +19,8 @@ class XLBrickAbstract(metaclass=abc.ABCMeta):
     Defines the interface for accessing and serializing brick data.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __getitem__(self):
         pass
@@ -32,10 +35,12 @@ class XLBricks(XLBrickAbstract):
     
     Supports hierarchical structures where bricks can contain other bricks.
     """
-    
+
+    __slots__ = ('key', 'bricks')
+
     def __init__(self, key=None, bricks=None):
         self.key = key
-        self.bricks = bricks or OrderedDict()
+        self.bricks = bricks if bricks is not None else {}
 
     def replace(self, keys, brick):
         """Replace a brick at a specific path in the hierarchy.
@@ -52,12 +57,21 @@ class XLBricks(XLBrickAbstract):
         else:
             xl_brick.value = brick.value
 
+    def shallow_copy(self):
+        """Copy the collection without copying the bricks it holds.
+        
+        The new collection has its own dict, so rebinding keys leaves the original untouched.
+        """
+        return XLBricks(self.key, dict(self.bricks))
+
     def __setitem__(self, key, brick):
         self.bricks[key] = brick
 
     def __getitem__(self, keys):
-        if len(keys) == 0:
+        if not keys:
             return self
+        if len(keys) == 1:
+            return self.bricks[keys[0]]
 
         node = self
         for key in keys:
@@ -69,29 +83,24 @@ class XLBricks(XLBrickAbstract):
         
         Recursively serializes all child bricks.
         """
-        child_dict = OrderedDict()
-        for key, qd_item in self.bricks.items():
-            child_dict[key] = qd_item.to_dict()
+        child_dict = {key: qd_item.to_dict() for key, qd_item in self.bricks.items()}
 
         if self.key is None:
             return child_dict
         else:
-            return OrderedDict([(self.key, child_dict)])
+            return {self.key: child_dict}
 
     def to_quantlib_dict(self):
         """Convert to dictionary with QuantLib-compatible types.
         
         Transforms dates, strings, and numeric values into QuantLib objects.
         """
-        f = np.vectorize(_cast_quantlib_variable)
-        child_dict = OrderedDict()
-        for key, qd_item in self.bricks.items():
-            child_dict[f(key).item()] = qd_item.to_quantlib_dict()
+        child_dict = {_cast_quantlib_variable(key): qd_item.to_quantlib_dict() for key, qd_item in self.bricks.items()}
 
         if self.key is None:
             return child_dict
         else:
-            return OrderedDict([(f(self.key).item(), child_dict)])
+            return {_cast_quantlib_variable(self.key): child_dict}
 
 
 class XLBrick(XLBrickAbstract):
@@ -100,6 +109,8 @@ class XLBrick(XLBrickAbstract):
     The fundamental data unit in XLBricks, wrapping any type of data.
     """
 
+    __slots__ = ('key', 'value')
+
     def __init__(self, key=None, value=None):
         self.key = key
         self.value = value
@@ -107,6 +118,10 @@ class XLBrick(XLBrickAbstract):
     def __getitem__(self, keys):
         pass
 
+    def shallow_copy(self):
+        """Copy the brick, sharing its value with the original."""
+        return XLBrick(self.key, self.value)
+
     def to_dict(self):
         """Convert the brick to a dictionary or return its raw value.
         
@@ -114,48 +129,111 @@ class XLBrick(XLBrickAbstract):
         """
         if self.key is None:
             return self.value
-        return OrderedDict([(self.key, self.value)])
+        return {self.key: self.value}
 
     def to_quantlib_dict(self):
         """Convert brick value to QuantLib-compatible format.
         
         Handles date conversion, type casting, and QuantLib object preservation.
         """
-        if 'QuantLib' in str(type(self.value)):
-            return self.value
-
-        f = np.vectorize(_cast_quantlib_variable)
-        if isinstance(self.value, np.ndarray):
-            xlb_array = f(self.value)
-        else:
-            xlb_array = np.array(f(self.value))
-
-        if xlb_array.shape == (1, 1):
-            if isinstance(xlb_array[0, 0], (np.float, np.int32, np.str, np.bool_)):
-                xlb_value = xlb_array[0, 0].item()
+        value = self.value
+        if type(value).__module__.startswith('QuantLib'):
+            return value
+
+        if isinstance(value, (list, tuple)) or hasattr(value, '__array__'):
+            xlb_array = _cast_quantlib_array(np.asarray(value))
+            if xlb_array.shape == (1, 1):
+                if xlb_array.dtype != object:
+                    xlb_value = xlb_array.item()
+                else:
+                    xlb_value = xlb_array[0, 0]
             else:
-                xlb_value = xlb_array[0, 0]
+                xlb_value = xlb_array.tolist()
         else:
-            xlb_value = xlb_array.tolist()
+            xlb_value = _cast_quantlib_variable(value)
 
         if self.key is None:
             return xlb_value
 
-        return OrderedDict([(f(self.key).item(), xlb_value)])
+        return {_cast_quantlib_variable(self.key): xlb_value}
 
 
 def _cast_quantlib_variable(x):
     """Convert Python values to QuantLib types.
     
     Handles datetime to ql.Date conversion, string evaluation, and type coercion.
+    Exact float/str/datetime types are tested first; subclasses such as numpy scalars fall through to isinstance.
+    """
+    t = type(x)
+    if t is float:
+        return int(x) if x.is_integer() else x
+    elif t is str:
+        return _cast_quantlib_string(x)
+    elif t is datetime:
+        return _quantlib_date(x)
+    elif isinstance(x, float):
+        return int(x) if x.is_integer() else x
+    elif isinstance(x, str):
+        return _cast_quantlib_string(x)
+    elif isinstance(x, datetime):
+        return _quantlib_date(x)
+    else:
+        return x
+
+
+def _cast_quantlib_string(x):
+    """Resolve 'ql.' expressions and 'true'/'false' strings; return other strings unchanged."""
+    if x.startswith('ql.'):
+        import QuantLib as ql
+        name = x[3:]
+        if name.isidentifier():
+            return getattr(ql, name)
+        return eval(_compile_quantlib_expression(x), {'__builtins__': {}, 'ql': ql})
+    return _BOOL_MAP.get(x.lower(), x)
+
+
+def _quantlib_date(x):
+    """Build a ql.Date from a date or datetime.
+    
+    QuantLib is imported here rather than at module level so loading bricks does not pay for it.
+    """
+    import QuantLib as ql
+    return ql.Date(x.day, x.month, x.year)
+
+
+@lru_cache(maxsize=1024)
+def _compile_quantlib_expression(expr):
+    """Compile a 'ql.' cell expression once and reuse the code object.
+    
+    Only the code object is cached; each cell still gets a freshly evaluated QuantLib object.
+    """
+    return compile(expr, '<quantlib>', 'eval')
+
+
+def _cast_quantlib_array(arr):
+    """Convert a numpy array to QuantLib-compatible values, dispatching on dtype.
+
+    Only object and string arrays are cast element by element; numeric arrays stay vectorized.
     """
-    if isinstance(x, datetime):
-        return ql.Date(x.day, x.month, x.year)
-    elif isinstance(x, float) and x.is_integer():
-        return int(x)
-    elif isinstance(x, str) and x[:3] == 'ql.':
-        return eval(x)
-    elif isinstance(x, str) and x.lower() in ['true', 'false']:
-        return bool(x)
+    kind = arr.dtype.kind
+    if kind == 'M':
+        dates = arr.astype('datetime64[D]').ravel().tolist()
+        out = np.empty(len(dates), dtype=object)
+        for idx, d in enumerate(dates):
+            out[idx] = None if d is None else _quantlib_date(d)
+        return out.reshape(arr.shape)
+    elif kind == 'f':
+        integral = np.isfinite(arr) & (arr == np.trunc(arr))
+        if not integral.any():
+            return arr
+        out = arr.astype(object)
+        out[integral] = arr[integral].astype(np.int64)
+        return out
+    elif kind in ('O', 'U', 'S'):
+        cast = _cast_quantlib_variable
+        out = np.empty(arr.size, dtype=object)
+        for idx, x in enumerate(arr.ravel().tolist()):
+            out[idx] = cast(x)
+        return out.reshape(arr.shape)
     else:
-        return x
\ No newline at end of file
+        return arr
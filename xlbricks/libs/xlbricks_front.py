@@ -4,7 +4,7 @@
     Description: XLBricksFront: wrapper around xlbricks with alias, persist flag, and counter.
 """
 
-import uuid
+import secrets
 
 
 class XLBricksFront(object):
@@ -13,6 +13,8 @@ class XLBricksFront(object):
     Manages brick references, counters, and whether they persist across sessions.
     """
 
+    __slots__ = ('counter', 'alias', 'xlbricks', 'persist', 'uuid')
+
     def __init__(self, alias, xlbricks, persist=True):
         """Initialize a front wrapper for bricks.
         
@@ -22,7 +24,7 @@ class XLBricksFront(object):
         self.alias = alias
         self.xlbricks = xlbricks
         self.persist = persist
-        self.uuid = str(uuid.uuid1())
+        self.uuid = secrets.token_hex(8)
 
     @property
     def bricks_name(self):
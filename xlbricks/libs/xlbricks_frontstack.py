@@ -13,9 +13,10 @@ class Singleton(object):
     """
 
     def __new__(cls):
-        if not hasattr(cls, 'instance'):
-            cls.instance = super(Singleton, cls).__new__(cls)
-        return cls.instance
+        instance = cls.__dict__.get('instance')
+        if instance is None:
+            instance = cls.instance = super(Singleton, cls).__new__(cls)
+        return instance
 
 
 class XLBricksFrontStack(Singleton):
@@ -24,7 +25,14 @@ class XLBricksFrontStack(Singleton):
     Singleton that maintains a dictionary of brick references accessible from Excel.
     """
 
-    front_stack = dict()
+    def __init__(self):
+        """Create the backing dictionary on first construction only."""
+        if self.__dict__.get('_initialized', False):
+            return
+        self.front_stack = dict()
+        # Bumped on every change to the stack, so viewers can skip rebuilding when nothing changed
+        self.version = 0
+        self._initialized = True
 
     def __contains__(self, item):
         """Check if a brick reference exists in the stack."""
@@ -33,6 +41,7 @@ class XLBricksFrontStack(Singleton):
     def __setitem__(self, key, value):
         """Store or update a brick in the stack."""
         self.front_stack[key] = value
+        self.version += 1
 
     def __getitem__(self, item):
         """Retrieve a brick from the stack by its reference."""
@@ -41,20 +50,25 @@ class XLBricksFrontStack(Singleton):
     def __delitem__(self, item):
         """Remove a brick from the stack."""
         del self.front_stack[item]
+        self.version += 1
 
     def clear(self):
-        """Remove all bricks from the stack."""
-        self.front_stack.clear()
+        """Remove all bricks from the stack.
+        
+        Swaps in a fresh dictionary so references held elsewhere to the old one are left untouched.
+        """
+        self.front_stack = dict()
+        self.version += 1
 
     def to_dict(self):
         """Export all bricks as a nested dictionary.
         
         Useful for viewing or serializing the entire brick collection.
         """
-        res_dict = dict()
-        for key, bricks_front in self.front_stack.items():
-            res_dict[key] = bricks_front.xlbricks.to_dict()
-        return res_dict
+        return {key: bricks_front.xlbricks.to_dict() for key, bricks_front in self.front_stack.items()}
+
+
+_STACK = XLBricksFrontStack()
 
 
 def add_bricks_to_front_stack(bricks: XLBricksFront):
@@ -62,10 +76,13 @@ def add_bricks_to_front_stack(bricks: XLBricksFront):
     
     Updates the counter if a brick with the same name already exists.
     """
+    front_stack = _STACK.front_stack
     container_name = bricks.bricks_name
-    if container_name in XLBricksFrontStack():
-        bricks.counter = XLBricksFrontStack()[container_name].counter + 1
-    XLBricksFrontStack()[container_name] = bricks
+    previous = front_stack.get(container_name)
+    if previous is not None:
+        bricks.counter = previous.counter + 1
+    front_stack[container_name] = bricks
+    _STACK.version += 1
 
 
 def delete_bricks_from_front_stack(bricks: XLBricksFront):
@@ -73,5 +90,5 @@ def delete_bricks_from_front_stack(bricks: XLBricksFront):
     
     Only deletes bricks that were created with persist=False.
     """
-    if not bricks.persist and bricks.bricks_name in XLBricksFrontStack():
-        del XLBricksFrontStack()[bricks.bricks_name]
+    if not bricks.persist and _STACK.front_stack.pop(bricks.bricks_name, None) is not None:
+        _STACK.version += 1
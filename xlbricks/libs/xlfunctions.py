@@ -7,12 +7,21 @@
 import numpy as np
 import pandas as pd
 import importlib
-from copy import deepcopy
+import re
 from xlbricks.libs.xlbricks import XLBrick, XLBricks
 from xlbricks.libs.xlbricks_front import XLBricksFront
 from xlbricks.libs.xlbricks_frontstack import XLBricksFrontStack
 from xlbricks.libs.utility_functions import XLUtils, XLBricksUtils, XLBricksFunction
 
+# Context classes keyed by (class_path, class_name), so recalculations skip importlib
+_CONTEXT_CLASS_CACHE = dict()
+
+# First tokens that open a new block in create_function_objects
+_FUNC_STARTERS = frozenset(('from', 'import', 'def'))
+
+# Separator of 'parent/child' key paths, swallowing whitespace around each '/'
+_SPLIT_RE = re.compile(r'[ \t\n\r]*/[ \t\n\r]*')
+
 
 @XLBricksFunction(False)
 def xlbrick_create(key, data, persist=True, xlapp=None):
@@ -36,17 +45,48 @@ def xlbricks_create(key_1, brick_1, key_2=None, brick_2=None, key_3=None, brick_
     Internal function called by xlb_bricks Excel function.
     """
 
-    xlbricks = XLBricks()
-    for idx in range(1, 9):
-        key = locals().get('key_%s' % idx, None)
-        xlbrick = locals().get('brick_%s' % idx, None)
-        if key is not None and xlbrick is not None:
-            xlbricks[key] = XLUtils.get_bricks(xlbrick)
+    keys = (key_1, key_2, key_3, key_4, key_5, key_6, key_7, key_8)
+    bricks = (brick_1, brick_2, brick_3, brick_4, brick_5, brick_6, brick_7, brick_8)
+    xlbricks = _bricks_from_pairs(keys, bricks)
 
     xlbricks_front = create_bricks_front(xlbricks, xlapp, persist)
     return xlbricks_front
 
 
+@XLBricksFunction(False)
+def xlbricks_create_pairs(pairs, persist=True, xlapp=None):
+    """Create multiple named bricks from a two-column range of (key, brick) rows.
+    
+    Internal function called by xlb_bricks_v2 Excel function; rows without a key are skipped.
+    """
+    pairs = XLUtils.crop_range(pairs)
+    if pairs.ndim != 2 or pairs.shape[1] != 2:
+        raise ValueError('pairs must be a two-column range of keys and bricks')
+
+    keys = pairs[:, 0]
+    filled = pd.notna(keys) & (keys.astype(object) != 'nan')
+    keys = [key if has_key else None for key, has_key in zip(keys.tolist(), filled)]
+    bricks = [pairs[idx:idx + 1, 1:2] for idx in range(len(keys))]
+    xlbricks = _bricks_from_pairs(keys, bricks)
+
+    xlbricks_front = create_bricks_front(xlbricks, xlapp, persist)
+    return xlbricks_front
+
+
+def _bricks_from_pairs(keys, bricks):
+    """Build an XLBricks collection from parallel keys and brick ranges.
+    
+    Bricks whose key is None are skipped; a reference passed more than once is resolved once.
+    """
+    resolved = XLUtils.get_bricks_batch([brick if key is not None else None for key, brick in zip(keys, bricks)])
+
+    xlbricks = XLBricks()
+    for key, xlbrick in zip(keys, resolved):
+        if xlbrick is not None:
+            xlbricks[key] = xlbrick
+    return xlbricks
+
+
 @XLBricksFunction(False)
 def array_create(data, persist=True, xlapp=None):
     """Create a brick containing array data.
@@ -66,7 +106,8 @@ def list_create(data, persist=True, xlapp=None):
     """
     xlbricks = XLUtils.get_bricks(data)
     if isinstance(xlbricks.value, np.ndarray):
-        xlbricks.value = xlbricks.value.flatten().tolist()
+        # ravel() is a view for contiguous ranges; row-major order is kept even for Fortran-ordered input
+        xlbricks.value = xlbricks.value.ravel().tolist()
     else:
         xlbricks.value = [xlbricks.value]
 
@@ -85,13 +126,21 @@ def table_create(data, columns=None, index=None, persist=True, xlapp=None):
 
     if index is not None:
         index_brick = XLUtils.get_bricks(index)
-        index = index_brick.value.flatten()
+        index = np.ravel(index_brick.value)
 
     if columns is not None:
         columns_brick = XLUtils.get_bricks(columns)
-        columns = columns_brick.value.flatten()
+        columns = np.ravel(columns_brick.value)
 
-    xlbrick = XLBrick(None, pd.DataFrame(data_brick.value, index, columns))
+    values = data_brick.value
+    if isinstance(values, np.ndarray) and values.ndim == 2 and not values.flags['F_CONTIGUOUS']:
+        # pandas stores columns contiguously; hand it a column-major copy it can use without copying again
+        table = pd.DataFrame(np.asfortranarray(values), index, columns, copy=False)
+    else:
+        # copy explicitly: pandas 2.x wraps a 2D ndarray without copying, sharing memory with the source brick
+        table = pd.DataFrame(values, index, columns, copy=True)
+
+    xlbrick = XLBrick(None, table)
     xlbrick_front = create_bricks_front(xlbrick, xlapp, persist)
     return xlbrick_front
 
@@ -104,17 +153,12 @@ def grid_create(data, persist=True, xlapp=None):
     """
     xlbricks = XLBricks()
 
-    if data.dtype.type is np.str_:
-        keys_idx = np.argwhere(np.array(data[:, 0]) != 'nan').flatten()
-    elif data.dtype.type is np.object_:
-        keys_idx = np.argwhere(np.array(~pd.isnull(data[:, 0]))).flatten()
-    else:
-        keys_idx = np.argwhere(np.array(~np.isnan(data[:, 0]))).flatten()
+    keys = data[:, 0]
+    keys_idx = np.flatnonzero(pd.notna(keys) & (keys.astype(object) != 'nan'))
+    bounds = np.append(keys_idx, len(data))
 
-    for f_idx, s_idx in zip(keys_idx, keys_idx[1:]):
-        xlbricks[data[f_idx, 0]] = XLUtils.get_bricks(data[f_idx:s_idx, 1:])
-
-    xlbricks[data[s_idx, 0]] = XLUtils.get_bricks(data[s_idx:, 1:])
+    for f_idx, s_idx in zip(bounds[:-1], bounds[1:]):
+        xlbricks[keys[f_idx]] = XLUtils.get_bricks(data[f_idx:s_idx, 1:])
 
     xlbricks_front = create_bricks_front(xlbricks, xlapp, persist)
     return xlbricks_front
@@ -127,7 +171,7 @@ def lookup_element(bricks, keys=None, persist=True, xlapp=None):
     Example: 'parent/child' retrieves the child brick from parent.
     """
     xlbricks = XLUtils.get_bricks(bricks)
-    keys = [key.strip(' \t\n\r') for key in keys.split('/')]
+    keys = _SPLIT_RE.split(keys.strip(' \t\n\r'))
     xlbricks_front = create_bricks_front(xlbricks[keys], xlapp, persist)
     return xlbricks_front
 
@@ -142,11 +186,16 @@ def flatten_bricks(bricks):
     xlbricks_value = xlbricks.value
 
     if not isinstance(xlbricks_value, np.ndarray):
-        xlbricks_value = np.array(xlbricks_value)
+        if not isinstance(xlbricks_value, (list, tuple)) and not hasattr(xlbricks_value, '__array__'):
+            return np.array([[xlbricks_value]], dtype=object)
+        xlbricks_value = np.asarray(xlbricks_value)
 
+    if xlbricks_value.ndim == 2:
+        return xlbricks_value
     if xlbricks_value.ndim == 1:
-        xlbricks_value = xlbricks_value.reshape(-1, 1)
-
+        return xlbricks_value.reshape(-1, 1)
+    if xlbricks_value.ndim == 0:
+        return xlbricks_value.reshape(1, 1)
     return xlbricks_value
 
 
@@ -155,21 +204,22 @@ def _func_line_sanitize(cell):
     
     Converts empty/NaN cells to empty strings while preserving indentation.
     """
-    if cell is None:
-        return ''
-    if isinstance(cell, (float, np.floating)) and np.isnan(cell):
-        return ''
-    try:
-        if pd.isnull(cell):
+    if not isinstance(cell, str):
+        if cell is None:
             return ''
-    except (TypeError, ValueError):
-        pass
-    s = str(cell) if isinstance(cell, str) else str(cell)
-    if not s.strip():
-        return ''
-    if s.strip().lower() == 'nan':
+        if isinstance(cell, (float, np.floating)) and np.isnan(cell):
+            return ''
+        try:
+            if pd.isnull(cell):
+                return ''
+        except (TypeError, ValueError):
+            pass
+        cell = str(cell)
+
+    stripped = cell.strip()
+    if not stripped or stripped.lower() == 'nan':
         return ''
-    return s
+    return cell
 
 
 @XLBricksFunction(False)
@@ -179,17 +229,20 @@ def create_function_objects(funcs, persist=True, xlapp=None):
     Allows defining custom functions directly in Excel ranges.
     """
 
-    funcs = XLUtils.get_bricks(funcs)
-    funcs = np.array([[funcs.value]] if isinstance(funcs.value, str) else funcs.value)
+    funcs = XLUtils.get_bricks(funcs).value
+    if isinstance(funcs, str):
+        rows = [[funcs]]
+    else:
+        rows = funcs.tolist() if isinstance(funcs, np.ndarray) else np.asarray(funcs).tolist()
 
+    sanitized = [_func_line_sanitize(row[0]) for row in rows]
     funcs_mask = list()
-    for row in funcs:
-        line = _func_line_sanitize(row[0])
-        first_char = line.split(' ')[0] if line else ''
-        funcs_mask.append(first_char == 'from' or first_char == 'import' or first_char == 'def')
+    for line in sanitized:
+        idx = line.find(' ')
+        funcs_mask.append((line if idx < 0 else line[:idx]) in _FUNC_STARTERS)
 
-    funcs_split_t = np.array_split(funcs[:, 0], np.argwhere(funcs_mask).flatten())
-    funcs_split = ['\n'.join(_func_line_sanitize(line) for line in func) for func in funcs_split_t[1:]]
+    funcs_split_t = np.array_split(np.array(sanitized, dtype=object), np.flatnonzero(funcs_mask))
+    funcs_split = ['\n'.join(func.tolist()) for func in funcs_split_t[1:]]
 
     # Ensure blocks ending with ':' (def/class/if/for etc.) have at least one indented line
     def _ensure_block_has_body(code):
@@ -201,7 +254,7 @@ def create_function_objects(funcs, persist=True, xlapp=None):
     funcs_split = [_ensure_block_has_body(block) for block in funcs_split]
 
     res = dict()
-    [exec(func, res) for func in funcs_split]
+    exec(compile('\n\n'.join(funcs_split), '<xlb_create_function>', 'exec'), res)
     xlbricks = {k: XLBrick(None, v) for k, v in res.items()}
     xlbricks_front = create_bricks_front(XLBricks(None, xlbricks), xlapp, persist)
     return xlbricks_front
@@ -297,11 +350,11 @@ def merge_elements(brick_1=None, brick_2=None, brick_3=None, brick_4=None,
     
     Merges all key-value pairs from input bricks.
     """
-    xlbricks = XLBricks()
-    for idx in range(1, 6):
-        brick = locals().get('brick_%s' % idx, None)
+    merged = dict()
+    for brick in XLUtils.get_bricks_batch((brick_1, brick_2, brick_3, brick_4, brick_5)):
         if brick is not None:
-            xlbricks.bricks.update(XLUtils.get_bricks(brick).bricks)
+            merged |= brick.bricks
+    xlbricks = XLBricks(None, merged)
     xlbricks_front = create_bricks_front(xlbricks, xlapp, persist)
     return xlbricks_front
 
@@ -314,16 +367,17 @@ def replace_elements(bricks, key_1, brick_1, key_2=None, brick_2=None, key_3=Non
     Replaces bricks at specified paths while keeping the rest unchanged.
     """
 
-    xlbricks = deepcopy(XLUtils.get_bricks(bricks))
-    xlbricks.alias = None
-    xlbricks.persist = persist
+    xlbricks = XLUtils.get_bricks(bricks).shallow_copy()
 
-    for idx in range(1, 6):
-        keys = locals().get('key_%s' % idx, None)
-        brick = locals().get('brick_%s' % idx, None)
-        if keys is not None and brick is not None:
-            keys = [key.strip(' \t\n\r') for key in keys.split('/')]
-            xlbricks.replace(keys, XLUtils.get_bricks(bricks))
+    paths = (key_1, key_2, key_3, key_4, key_5)
+    replacements = XLUtils.get_bricks_batch([brick if keys is not None else None for keys, brick in
+                                             zip(paths, (brick_1, brick_2, brick_3, brick_4, brick_5))])
+
+    for keys, brick in zip(paths, replacements):
+        if brick is not None:
+            keys = _SPLIT_RE.split(keys.strip(' \t\n\r'))
+            _copy_path(xlbricks, keys)
+            xlbricks.replace(keys, brick)
 
     xlbricks_front = create_bricks_front(xlbricks, xlapp, persist)
     return xlbricks_front
@@ -358,15 +412,27 @@ def clear_bricks_front():
     XLBricksFrontStack().clear()
 
 
+def _copy_path(xlbricks, keys):
+    """Shallow-copy the bricks along a key path in place.
+    
+    Lets replace() rebind or overwrite the path without touching bricks shared with the source.
+    """
+    node = xlbricks
+    for key in keys:
+        if not isinstance(node, XLBricks) or key not in node.bricks:
+            return
+        node[key] = node.bricks[key].shallow_copy()
+        node = node.bricks[key]
+
+
 def create_bricks_front(xlbricks, xlapp, persist):
     """Wrap bricks in a front object with persistence tracking.
     
     Associates bricks with their Excel cell location if persist is True.
     """
-    if persist:
-        cell_address = XLUtils.active_cell_address(xlapp)
-    else:
-        cell_address = None
+    # The caller's address is read only for persisted fronts; it is not cached across calls because
+    # every UDF call gets its own Application proxy and a different calling cell
+    cell_address = XLUtils.active_cell_address(xlapp) if persist else None
     xlbricks_front = XLBricksFront(cell_address, xlbricks, persist)
     return xlbricks_front
 
@@ -376,8 +442,11 @@ def get_context_object(class_name: str, class_path: str) -> object:
     
     Dynamically loads Python classes for instantiation.
     """
-    module = importlib.import_module(class_path)
-    class_object = getattr(module, class_name)
+    key = (class_path, class_name)
+    class_object = _CONTEXT_CLASS_CACHE.get(key)
+    if class_object is None:
+        module = importlib.import_module(class_path)
+        class_object = _CONTEXT_CLASS_CACHE[key] = getattr(module, class_name)
     return class_object
 
 def _run_quantlib_function(func, args_dict):
@@ -0,0 +1,119 @@
+"""
+    Author: julij.jegorov
+    Date: 15/02/2026
+    Description: Unit tests for generate_vba (VBA result cache for xlb_cached UDF wrappers).
+"""
+
+import unittest
+import sys
+import os
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_xlbricks = os.path.dirname(_here)
+_root = os.path.dirname(_xlbricks)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+# generate_vba reads the xlb_cached markers from xlbfunctions; skip if its deps are unavailable
+try:
+    from xlbricks.generate_vba import patch_vba, cached_function_names
+    from xlbricks import xlbfunctions
+    GENERATE_VBA_AVAILABLE = True
+    _import_error = ''
+except ImportError as e:
+    GENERATE_VBA_AVAILABLE = False
+    _import_error = str(e)
+
+
+_SOURCE = '''Attribute VB_Name = "xlwings_udfs"
+'Autogenerated code by xlwings - changes will be lost with next import!
+#Const App = "Microsoft Excel"
+
+Function xlb_flatten(brick)
+    #If App = "Microsoft Excel" Then
+        If TypeOf Application.Caller Is Range Then On Error GoTo failed
+        xlb_flatten = Py.CallUDF("xlbfunctions", "xlb_flatten", Array(brick), ActiveWorkbook, Application.Caller)
+        Exit Function
+    #Else
+        xlb_flatten = Py.CallUDF("xlbfunctions", "xlb_flatten", Array(brick))
+        Exit Function
+    #End If
+failed:
+    xlb_flatten = Err.Description
+End Function
+
+Function xlb_clear_bricks_front()
+    #If App = "Microsoft Excel" Then
+        xlb_clear_bricks_front = Py.CallUDF("xlbfunctions", "xlb_clear_bricks_front", Array(), ActiveWorkbook, Application.Caller)
+        Exit Function
+    #End If
+End Function
+
+Function xlb_today()
+    #If App = "Microsoft Excel" Then
+        xlb_today = Py.CallUDF("xlbfunctions", "xlb_today", Array(), ActiveWorkbook, Application.Caller)
+        Exit Function
+    #End If
+End Function
+
+Function xlb_session()
+    #If App = "Microsoft Excel" Then
+        xlb_session = Py.CallUDF("xlbfunctions", "xlb_session", Array(), ActiveWorkbook, Application.Caller)
+        Exit Function
+    #End If
+End Function
+'''
+
+
+@unittest.skipUnless(GENERATE_VBA_AVAILABLE, "generate_vba deps not available: " + _import_error)
+class TestPatchVba(unittest.TestCase):
+    def setUp(self):
+        self.lines = patch_vba(_SOURCE, ['xlb_flatten']).splitlines()
+
+    def _body(self, fname):
+        start = self.lines.index('Function %s(%s)' % (fname, 'brick' if fname == 'xlb_flatten' else ''))
+        return self.lines[start:self.lines.index('End Function', start)]
+
+    def test_helpers_before_first_procedure(self):
+        self.assertLess(self.lines.index('Private xlbCache As Object'), self.lines.index('Function xlb_flatten(brick)'))
+        self.assertEqual(self.lines[0], 'Attribute VB_Name = "xlwings_udfs"')
+
+    def test_cached_wrapper_looks_up_and_stores(self):
+        body = self._body('xlb_flatten')
+        self.assertEqual(body[2], '    xlbKey = XLBCacheKey("xlb_flatten", Array(brick))')
+        self.assertEqual(body.count('        XLBCacheStore xlbKey, xlbResult'), 2)
+        self.assertEqual(body.count('        xlb_flatten = xlbResult'), 2)
+        self.assertIn('    xlb_flatten = Err.Description', body)
+
+    def test_clear_wrapper_resets_cache(self):
+        self.assertEqual(self._body('xlb_clear_bricks_front')[1].strip(), 'Set xlbCache = Nothing')
+
+    def test_unmarked_wrapper_untouched(self):
+        self.assertNotIn('xlbKey', '\n'.join(self._body('xlb_today')))
+
+    def test_lookup_checks_server_session(self):
+        has = self.lines.index('Private Function XLBCacheHas(key As String) As Boolean')
+        self.assertEqual(self.lines[has + 2].strip(), 'XLBCacheCheckSession')
+        self.assertIn('    session = xlb_session()', self.lines)
+
+    def test_store_capped(self):
+        self.assertIn('    If xlbCache.Count >= XLB_CACHE_SIZE Then xlbCache.RemoveAll', self.lines)
+
+    def test_missing_session_wrapper_rejected(self):
+        source = _SOURCE[:_SOURCE.index('Function xlb_session()')]
+        with self.assertRaises(ValueError):
+            patch_vba(source, ['xlb_flatten'])
+
+    def test_patching_twice_rejected(self):
+        with self.assertRaises(ValueError):
+            patch_vba('\r\n'.join(self.lines), ['xlb_flatten'])
+
+
+@unittest.skipUnless(GENERATE_VBA_AVAILABLE, "generate_vba deps not available: " + _import_error)
+class TestCachedFunctionNames(unittest.TestCase):
+    def test_marked_udfs(self):
+        self.assertEqual(cached_function_names(xlbfunctions), ['xlb_flatten'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,331 @@
+"""
+    Author: julij.jegorov
+    Date: 15/02/2026
+    Description: Unit tests for the UI package (config editor, tree/table models); runs without Excel.
+"""
+
+import unittest
+from unittest import mock
+import json
+import sys
+import os
+import tempfile
+import numpy as np
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_xlbricks = os.path.dirname(_here)
+_root = os.path.dirname(_xlbricks)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+# The UI needs PyQt5 (and a Qt platform plugin, e.g. QT_QPA_PLATFORM=offscreen); skip if unavailable
+try:
+    from PyQt5.QtCore import Qt, QModelIndex
+    from PyQt5.QtWidgets import QApplication
+    import pandas as pd
+    from xlbricks.ui import config_editor
+    from xlbricks.ui.pandas_model import PandasModel
+    from xlbricks.ui.explorer import Explorer
+    from xlbricks.ui.tree_model import DictionaryTreeModel
+    from xlbricks.libs.xlbricks import XLBrick
+    from xlbricks.libs.xlbricks_front import XLBricksFront
+    from xlbricks.libs.xlbricks_frontstack import XLBricksFrontStack, add_bricks_to_front_stack
+    from xlbricks.ui.tree_model import node_structure_from_dict
+    UI_AVAILABLE = True
+    _import_error = ''
+except ImportError as e:
+    UI_AVAILABLE = False
+    _import_error = str(e)
+
+
+def _qapp():
+    """Return the running QApplication, creating one if needed."""
+    return QApplication.instance() or QApplication([])
+
+
+@unittest.skipUnless(UI_AVAILABLE, "UI deps not available: " + _import_error)
+class TestConfigTableModels(unittest.TestCase):
+    def test_insert_edit_remove(self):
+        model = config_editor.ContextModel()
+        model.append_row()
+        model.append_row(['ql', 'QuantLib'])
+        self.assertTrue(model.setData(model.index(0, 0), 'ctx'))
+        self.assertEqual(model.rows(), [['ctx', ''], ['ql', 'QuantLib']])
+
+        model.removeRows(0, 1)
+        self.assertEqual(model.rowCount(), 1)
+        self.assertEqual(model.data(model.index(0, 1)), 'QuantLib')
+
+    def test_headers(self):
+        model = config_editor.PathListModel()
+        self.assertEqual(model.headerData(0, Qt.Horizontal), 'Path')
+        self.assertEqual(model.columnCount(), 1)
+
+
+@unittest.skipUnless(UI_AVAILABLE, "UI deps not available: " + _import_error)
+class TestConfigEditorDialog(unittest.TestCase):
+    def setUp(self):
+        self._app = _qapp()
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, 'xlbricks.json')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'APPS_PATH': 'apps', 'PYTHONPATH': 'a;b', 'CONTEXT': {'ql': 'QuantLib'}, 'EXTRA': 1}, f)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_load_and_collect_round_trip(self):
+        dialog = config_editor.ConfigEditorDialog(self.path)
+        data = dialog._collect_from_ui()
+        self.assertEqual(data['APPS_PATH'], 'apps')
+        self.assertEqual(data['PYTHONPATH'].split(os.pathsep), ['a', 'b'])
+        self.assertEqual(data['CONTEXT'], {'ql': 'QuantLib'})
+
+    def test_mixed_separators_loaded(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'PYTHONPATH': 'a;b\nc' + os.pathsep + ' d '}, f)
+        dialog = config_editor.ConfigEditorDialog(self.path)
+        self.assertEqual(dialog._path_model.rows(), [['a'], ['b'], ['c'], ['d']])
+
+    def test_load_resets_each_table_once(self):
+        dialog = config_editor.ConfigEditorDialog(self.path)
+        events = []
+        for model in (dialog._path_model, dialog._context_model):
+            model.modelReset.connect(lambda: events.append('reset'))
+            model.rowsInserted.connect(lambda *args: events.append('insert'))
+        dialog._load_into_ui()
+        self.assertEqual(events, ['reset', 'reset'])
+
+    def test_added_rows_collected(self):
+        dialog = config_editor.ConfigEditorDialog(self.path)
+        dialog._path_model.append_row(['  c  '])
+        dialog._add_context_row()
+        data = dialog._collect_from_ui()
+        self.assertEqual(data['PYTHONPATH'].split(os.pathsep), ['a', 'b', 'c'])
+        self.assertEqual(data['CONTEXT'], {'ql': 'QuantLib'})
+
+    def test_save_keeps_unedited_keys(self):
+        dialog = config_editor.ConfigEditorDialog(self.path)
+        dialog._apps_path_edit.setText('new_apps')
+        dialog.accept = lambda: None
+        with mock.patch.object(config_editor.QMessageBox, 'exec_', return_value=0):
+            dialog._save()
+        with open(self.path, encoding='utf-8') as f:
+            saved = json.load(f)
+        self.assertEqual(saved['APPS_PATH'], 'new_apps')
+        self.assertEqual(saved['EXTRA'], 1)
+        self.assertEqual(config_editor.load_config(self.path)['APPS_PATH'], 'new_apps')
+
+    def test_directory_dialog_options(self):
+        QFileDialog = config_editor.QFileDialog
+        with mock.patch.dict(os.environ, {'XLBRICKS_NATIVE_DIALOG': '1'}):
+            options = config_editor._directory_dialog_options()
+        self.assertTrue(options & QFileDialog.DontUseCustomDirectoryIcons)
+        self.assertTrue(options & QFileDialog.ShowDirsOnly)
+        self.assertFalse(options & QFileDialog.DontUseNativeDialog)
+        with mock.patch.dict(os.environ, {'XLBRICKS_NATIVE_DIALOG': '0'}):
+            self.assertTrue(config_editor._directory_dialog_options() & QFileDialog.DontUseNativeDialog)
+
+
+@unittest.skipUnless(UI_AVAILABLE, "UI deps not available: " + _import_error)
+class TestLoadConfig(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, 'xlbricks.json')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _write(self, data):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_cached_copy_is_private(self):
+        self._write({'CONTEXT': {'ql': 'QuantLib'}})
+        config_editor.load_config(self.path)['CONTEXT']['ql'] = 'changed'
+        self.assertEqual(config_editor.load_config(self.path)['CONTEXT'], {'ql': 'QuantLib'})
+
+    def test_changed_file_reparsed(self):
+        self._write({'APPS_PATH': 'a'})
+        self.assertEqual(config_editor.load_config(self.path)['APPS_PATH'], 'a')
+        self._write({'APPS_PATH': 'longer'})
+        self.assertEqual(config_editor.load_config(self.path)['APPS_PATH'], 'longer')
+
+    def test_save_layout_depends_on_context_size(self):
+        config_editor.save_config(self.path, {'CONTEXT': {'ql': 'QuantLib'}})
+        with open(self.path, encoding='utf-8') as f:
+            self.assertIn('\n    ', f.read())
+
+        context = {'c%s' % i: 'module_%s' % i for i in range(config_editor._COMPACT_CONTEXT_SIZE + 1)}
+        config_editor.save_config(self.path, {'CONTEXT': context})
+        with open(self.path, encoding='utf-8') as f:
+            self.assertNotIn('\n', f.read())
+        self.assertEqual(config_editor.load_config(self.path)['CONTEXT'], context)
+
+    def test_invalid_json_returns_default(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{not json')
+        self.assertEqual(config_editor.load_config(self.path), config_editor._default_config())
+
+
+@unittest.skipUnless(UI_AVAILABLE, "UI deps not available: " + _import_error)
+class TestPandasModel(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({'x': [1 / 3, 2.0], 'y': ['a', None]}, index=[10, 20])
+        self.model = PandasModel(self.df)
+
+    def test_cells_formatted(self):
+        self.assertEqual(self.model.data(self.model.index(0, 0)), '0.33333')
+        self.assertEqual(self.model.data(self.model.index(1, 0)), '2.0')
+        self.assertEqual(self.model.data(self.model.index(0, 1)), 'a')
+
+    def test_formatted_cells_cached(self):
+        first = self.model.data(self.model.index(0, 0))
+        self.assertIs(self.model.data(self.model.index(0, 0)), first)
+        self.assertIn((0, 0), self.model._display)
+
+    def test_headers(self):
+        self.assertEqual(self.model.headerData(1, Qt.Horizontal), 'y')
+        self.assertEqual(self.model.headerData(1, Qt.Vertical), '20')
+        self.assertFalse(self.model.headerData(5, Qt.Horizontal).isValid())
+
+    def test_counts(self):
+        self.assertEqual((self.model.rowCount(), self.model.columnCount()), (2, 2))
+
+    def test_array_input(self):
+        model = PandasModel(np.array([[1.0, 2.0], [3.0, 4.123456]]))
+        self.assertEqual((model.rowCount(), model.columnCount()), (2, 2))
+        self.assertEqual(model.data(model.index(1, 1)), '4.12346')
+        self.assertEqual(model.headerData(1, Qt.Horizontal), 1)
+        self.assertEqual(model.headerData(1, Qt.Vertical), '1')
+
+    def test_1d_array_shown_as_column(self):
+        model = PandasModel(np.array(['a', 'b', 'c']))
+        self.assertEqual((model.rowCount(), model.columnCount()), (3, 1))
+        self.assertEqual(model.data(model.index(2, 0)), 'c')
+
+    def test_mixed_int_float_columns_keep_ints(self):
+        model = PandasModel(pd.DataFrame({'i': [1, 2], 'f': [0.5, 1.5]}))
+        self.assertEqual(model.data(model.index(0, 0)), '1')
+        self.assertEqual(model.data(model.index(0, 1)), '0.5')
+
+    def test_datetime_column_formatted_as_timestamp(self):
+        model = PandasModel(pd.DataFrame({'d': pd.to_datetime(['2024-01-01', '2024-01-02'])}))
+        self.assertEqual(model.data(model.index(0, 0)), '2024-01-01 00:00:00')
+
+    def test_set_dataframe_replaces_contents(self):
+        self.model.data(self.model.index(0, 0))
+        resets = []
+        self.model.modelReset.connect(lambda: resets.append(True))
+        self.model.set_dataframe(pd.DataFrame({'z': [7.0, 8.0, 9.0]}))
+        self.assertEqual(resets, [True])
+        self.assertEqual((self.model.rowCount(), self.model.columnCount()), (3, 1))
+        self.assertEqual(self.model.data(self.model.index(0, 0)), '7.0')
+
+
+@unittest.skipUnless(UI_AVAILABLE, "UI deps not available: " + _import_error)
+class TestNodeStructureFromDict(unittest.TestCase):
+    def test_nested_order_and_values(self):
+        root = node_structure_from_dict({'b': 1, 'a': {'y': 2, 'x': {'z': 3}}, 3: 'c'})
+        self.assertEqual([root.child(i).name for i in range(root.child_count())], ['b', 'a', '3'])
+        inner = root.child(1)
+        self.assertEqual([inner.child(i).name for i in range(inner.child_count())], ['y', 'x'])
+        self.assertEqual(inner.child(1).child(0).value, 3)
+
+    def test_dataframe_kept_whole(self):
+        df = pd.DataFrame({'x': range(100)})
+        root = node_structure_from_dict({'table': df})
+        self.assertIs(root.child(0).value, df)
+
+    def test_rows_match_sibling_positions(self):
+        root = node_structure_from_dict({'a': 1, 'b': {'c': 2, 'd': 3}, 'e': 4})
+        self.assertIsNone(root.row())
+        for i in range(root.child_count()):
+            self.assertEqual(root.child(i).row(), i)
+        self.assertEqual(root.child(1).child(1).row(), 1)
+
+    def test_node_columns_compared_by_value(self):
+        node = node_structure_from_dict({'a': 5}).child(0)
+        self.assertEqual(node.data(np.int64(0)), 'a')
+        self.assertEqual(node.data(1), 5)
+        self.assertIsNone(node.data(2))
+        node.set_data(np.int64(1), 6)
+        self.assertEqual(node.value, 6)
+
+    def test_deep_nesting(self):
+        data = leaf = dict()
+        for _ in range(sys.getrecursionlimit() + 100):
+            leaf['k'] = dict()
+            leaf = leaf['k']
+        root = node_structure_from_dict(data)
+        self.assertEqual(root.child(0).name, 'k')
+
+    def test_model_index_bounds(self):
+        model = DictionaryTreeModel(node_structure_from_dict({'a': 1, 'b': 2}))
+        self.assertEqual(model.rowCount(QModelIndex()), 2)
+        self.assertEqual(model.index(1, 0, QModelIndex()).internalPointer().name, 'b')
+        self.assertFalse(model.index(2, 0, QModelIndex()).isValid())
+        self.assertFalse(model.index(-1, 0, QModelIndex()).isValid())
+
+
+@unittest.skipUnless(UI_AVAILABLE, "UI deps not available: " + _import_error)
+class TestExplorer(unittest.TestCase):
+    def setUp(self):
+        self._app = _qapp()
+
+    def _select(self, data):
+        explorer = Explorer(DictionaryTreeModel(node_structure_from_dict({'item': data})))
+        tree = explorer._tree_view
+        tree.setCurrentIndex(tree.model().index(0, 0, tree.rootIndex()))
+        explorer.load_data_frame()
+        return explorer._table_view.model()
+
+    def test_large_dataframe_truncated_for_display(self):
+        model = self._select(pd.DataFrame({'x': range(100)}))
+        self.assertEqual(model.rowCount(), 25)
+
+    def test_large_array_truncated_for_display(self):
+        model = self._select(np.zeros((100, 3)))
+        self.assertEqual((model.rowCount(), model.columnCount()), (25, 3))
+
+    def test_refresh_keeps_tree_model(self):
+        explorer = Explorer(DictionaryTreeModel(node_structure_from_dict({})))
+        model = explorer._tree_view.model()
+        add_bricks_to_front_stack(XLBricksFront('refreshed', XLBrick(None, 1.0), True))
+        try:
+            explorer._tree_view.refresh()
+        finally:
+            XLBricksFrontStack().clear()
+        self.assertIs(explorer._tree_view.model(), model)
+        self.assertEqual(model.rowCount(QModelIndex()), 1)
+
+    def test_refresh_skipped_when_stack_unchanged(self):
+        explorer = Explorer(DictionaryTreeModel(node_structure_from_dict({})))
+        model = explorer._tree_view.model()
+        explorer._tree_view.refresh()
+        resets = []
+        model.modelReset.connect(lambda: resets.append(True))
+        explorer._tree_view.refresh()
+        self.assertEqual(resets, [])
+        XLBricksFrontStack().clear()
+        explorer._tree_view.refresh()
+        self.assertEqual(resets, [True])
+
+    def test_table_model_reused(self):
+        table = Explorer(DictionaryTreeModel(node_structure_from_dict({})))._table_view
+        table.refresh()
+        model = table.model()
+        table.refresh(1.0)
+        self.assertIs(table.model(), model)
+        self.assertEqual((model.rowCount(), model.columnCount()), (1, 1))
+        table.refresh(None)
+        self.assertIs(table.model(), model)
+        self.assertEqual(model.rowCount(), 0)
+
+    def test_scalar_displayed(self):
+        model = self._select(1.5)
+        self.assertEqual((model.rowCount(), model.columnCount()), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
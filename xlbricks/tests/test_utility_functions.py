@@ -0,0 +1,212 @@
+"""
+    Author: julij.jegorov
+    Date: 15/02/2026
+    Description: Unit tests for utility_functions (XLUtils range cropping and brick conversion).
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_xlbricks = os.path.dirname(_here)
+_root = os.path.dirname(_xlbricks)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+# utility_functions pulls in pandas and QuantLib via the brick structures; skip if unavailable
+try:
+    from xlbricks.libs.utility_functions import XLUtils, XLBricksUtils, XLBricksFunction, _crop_bounds_f64_py
+    from xlbricks.libs.xlbricks import XLBrick
+    from xlbricks.libs.xlbricks_front import XLBricksFront
+    from xlbricks.libs.xlbricks_frontstack import XLBricksFrontStack, add_bricks_to_front_stack
+    UTILS_AVAILABLE = True
+    _import_error = ''
+except ImportError as e:
+    UTILS_AVAILABLE = False
+    _import_error = str(e)
+
+
+@unittest.skipUnless(UTILS_AVAILABLE, "utility_functions deps not available: " + _import_error)
+class TestCropRange(unittest.TestCase):
+    def test_float_borders_removed(self):
+        nan = np.nan
+        data = np.array([
+            [nan, nan, nan, nan],
+            [nan, 1.0, 2.0, nan],
+            [nan, 3.0, nan, nan],
+            [nan, nan, nan, nan],
+        ])
+        out = XLUtils.crop_range(data)
+        self.assertEqual(out.shape, (2, 2))
+        self.assertEqual(out[0, 0], 1.0)
+        self.assertTrue(np.isnan(out[1, 1]))
+
+    def test_string_borders_removed(self):
+        data = np.array([
+            ['nan', 'nan', 'nan'],
+            ['nan', 'a', 'b'],
+        ])
+        out = XLUtils.crop_range(data)
+        self.assertEqual(out.tolist(), [['a', 'b']])
+
+    def test_object_borders_removed(self):
+        data = np.array([
+            [None, None],
+            ['x', None],
+            [None, None],
+        ], dtype=object)
+        out = XLUtils.crop_range(data)
+        self.assertEqual(out.tolist(), [['x']])
+
+    def test_interior_empty_rows_kept(self):
+        nan = np.nan
+        data = np.array([[1.0], [nan], [2.0]])
+        out = XLUtils.crop_range(data)
+        self.assertEqual(out.shape, (3, 1))
+
+    def test_all_empty_returns_empty(self):
+        data = np.full((3, 2), np.nan)
+        out = XLUtils.crop_range(data)
+        self.assertEqual(out.size, 0)
+
+    def test_returns_view(self):
+        data = np.array([[np.nan, np.nan], [np.nan, 5.0]])
+        out = XLUtils.crop_range(data)
+        self.assertTrue(np.shares_memory(out, data))
+
+    def test_large_range_returns_view(self):
+        data = np.full((200, 100), np.nan)
+        data[10:150, 5:60] = 1.0
+        out = XLUtils.crop_range(data)
+        self.assertEqual(out.shape, (140, 55))
+        self.assertTrue(np.shares_memory(out, data))
+
+
+@unittest.skipUnless(UTILS_AVAILABLE, "utility_functions deps not available: " + _import_error)
+class TestLazyNumba(unittest.TestCase):
+    def test_kernel_not_built_at_import(self):
+        import subprocess
+        code = ('import sys; sys.path.insert(0, %r); import xlbricks.libs.utility_functions as u; '
+                'print(u._CROP_KERNEL)' % _root)
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), 'None')
+
+
+@unittest.skipUnless(UTILS_AVAILABLE, "utility_functions deps not available: " + _import_error)
+class TestGetBricks(unittest.TestCase):
+    def test_numeric_strings_cast_to_float(self):
+        brick = XLUtils.get_bricks(np.array([['1', '2.5'], ['3', '4']]))
+        self.assertEqual(brick.value.dtype, np.float64)
+        self.assertEqual(brick.value.tolist(), [[1.0, 2.5], [3.0, 4.0]])
+
+    def test_mixed_strings_keep_text(self):
+        brick = XLUtils.get_bricks(np.array([['a', '2'], ['b', 'x']]))
+        self.assertEqual(brick.value.tolist(), [['a', 2.0], ['b', 'x']])
+
+    def test_fast_path_parses_like_column_path(self):
+        # float() accepts '1_000' but pd.to_numeric does not; the result must not depend on the other cells
+        self.assertEqual(XLUtils.get_bricks(np.array([['1_000', '2']])).value.tolist(), [['1_000', 2.0]])
+        self.assertEqual(XLUtils.get_bricks(np.array([['1_000', 'abc']])).value.tolist(), [['1_000', 'abc']])
+
+    def test_reference_with_colon_in_alias_resolves(self):
+        front = XLBricksFront('[Book1]Sheet1!$A$1:$B$2', XLBrick(None, 42))
+        add_bricks_to_front_stack(front)
+        try:
+            brick = XLUtils.get_bricks(np.array([[front.bricks_full_name]]))
+            self.assertEqual(brick.value, 42)
+        finally:
+            XLBricksFrontStack().clear()
+
+    def test_batch_resolves_repeated_reference_once(self):
+        front = XLBricksFront(None, XLBrick(None, 42), False)
+        add_bricks_to_front_stack(front)
+        try:
+            reference = np.array([[front.bricks_full_name]])
+            first, missing, second = XLUtils.get_bricks_batch((reference, None, np.array([[front.bricks_full_name]])))
+            self.assertIsNone(missing)
+            self.assertIs(first, second)
+            self.assertEqual(second.value, 42)
+        finally:
+            XLBricksFrontStack().clear()
+
+
+class _FakeCom(object):
+    """Minimal stand-in for an Excel COM object exposing Name/Parent/Address/Caller."""
+
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+
+@unittest.skipUnless(UTILS_AVAILABLE, "utility_functions deps not available: " + _import_error)
+class TestActiveCellAddress(unittest.TestCase):
+    def test_address_format(self):
+        workbook = _FakeCom(Name='Book1.xlsx')
+        worksheet = _FakeCom(Name='Sheet1', Parent=workbook)
+        xl_app = _FakeCom(Caller=_FakeCom(Parent=worksheet, Address='$A$1'))
+        self.assertEqual(XLUtils.active_cell_address(xl_app), '[Book1.xlsx]Sheet1!$A$1')
+
+    def test_renamed_sheet_uses_new_name(self):
+        workbook = _FakeCom(Name='Book1.xlsx')
+        worksheet = _FakeCom(Name='Sheet1', Parent=workbook)
+        XLUtils.active_cell_address(_FakeCom(Caller=_FakeCom(Parent=worksheet, Address='$A$1')))
+        worksheet.Name = 'Renamed'
+        out = XLUtils.active_cell_address(_FakeCom(Caller=_FakeCom(Parent=worksheet, Address='$B$2')))
+        self.assertEqual(out, '[Book1.xlsx]Renamed!$B$2')
+
+
+@unittest.skipUnless(UTILS_AVAILABLE, "utility_functions deps not available: " + _import_error)
+class TestXLBricksUtils(unittest.TestCase):
+    def test_element_from_dictionary_nested(self):
+        bricks = XLBricksUtils.element_from_dictionary({'a': 1.5, 'b': {'c': 'x'}})
+        self.assertEqual(bricks.to_dict(), {'a': 1.5, 'b': {'c': 'x'}})
+        self.assertEqual(bricks[['b', 'c']].value, 'x')
+
+    def test_element_from_list_numbered_keys(self):
+        bricks = XLBricksUtils.element_from_list([10, 20], 'f_res')
+        self.assertEqual(bricks.to_dict(), {'f_res_1': 10, 'f_res_2': 20})
+
+
+@unittest.skipUnless(UTILS_AVAILABLE, "utility_functions deps not available: " + _import_error)
+class TestXLBricksFunction(unittest.TestCase):
+    def tearDown(self):
+        XLBricksFrontStack().clear()
+
+    def test_metadata_preserved(self):
+        def sample(data, persist=True):
+            """Sample docstring."""
+            return XLBricksFront(None, XLBrick(None, data), persist)
+
+        wrapped = XLBricksFunction(False)(sample)
+        self.assertEqual(wrapped.__name__, 'sample')
+        self.assertEqual(wrapped.__doc__, 'Sample docstring.')
+        self.assertIs(wrapped.__wrapped__, sample)
+
+    def test_dynamic_returns_raw_output(self):
+        wrapped = XLBricksFunction(True)(lambda: 42)
+        self.assertEqual(wrapped(), 42)
+
+    def test_front_registered_and_referenced(self):
+        wrapped = XLBricksFunction(False)(lambda: XLBricksFront(None, XLBrick(None, 1.0), False))
+        reference = wrapped()
+        self.assertEqual(XLUtils.get_bricks(np.array([[reference]])).value, 1.0)
+
+
+@unittest.skipUnless(UTILS_AVAILABLE, "utility_functions deps not available: " + _import_error)
+class TestCropBoundsKernel(unittest.TestCase):
+    def test_matches_mask_crop(self):
+        data = np.full((40, 30), np.nan)
+        data[4:20, 7:25] = 1.0
+        data[10, 7] = np.nan
+        r0, r1, c0, c1 = _crop_bounds_f64_py(data)
+        expected = XLUtils._crop_range(data, np.isnan)
+        self.assertEqual(data[r0:r1 + 1, c0:c1 + 1].shape, expected.shape)
+
+    def test_all_nan_reports_empty(self):
+        r0, r1, _, _ = _crop_bounds_f64_py(np.full((4, 4), np.nan))
+        self.assertLess(r1, r0)
+
+
+if __name__ == '__main__':
+    unittest.main()
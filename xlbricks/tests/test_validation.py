@@ -20,6 +20,10 @@ from xlbricks.libs.validation import (
     _is_missing,
     _check_required,
     _check_array_2d,
+    _any_non_nan_py,
+    _validate,
+    _REQUIRED,
+    _ARRAY_2D,
     _ERROR_PREFIX,
 )
 
@@ -57,6 +61,37 @@ class TestIsMissing(unittest.TestCase):
     def test_valid_array_not_missing(self):
         self.assertFalse(_is_missing(np.array([[1, 2], [3, 4]])))
 
+    def test_partially_nan_array_not_missing(self):
+        self.assertFalse(_is_missing(np.array([[np.nan, 1.0]])))
+        self.assertFalse(_is_missing(np.array([[1.0, np.nan]])))
+
+    def test_non_contiguous_array(self):
+        data = np.full((4, 6), np.nan)
+        data[3, 5] = 1.0
+        self.assertFalse(_is_missing(data.T))
+        self.assertTrue(_is_missing(data[:3, ::2]))
+
+    def test_float16_array(self):
+        self.assertTrue(_is_missing(np.array([[np.nan, np.nan]], dtype=np.float16)))
+        self.assertFalse(_is_missing(np.array([[np.nan, 1.0]], dtype=np.float16)))
+
+    def test_pandas_series(self):
+        import pandas as pd
+        self.assertFalse(_is_missing(pd.Series([1.0, np.nan])))
+        self.assertTrue(_is_missing(pd.Series([np.nan, np.nan])))
+        self.assertTrue(_is_missing(pd.Series([], dtype=float)))
+
+    def test_any_non_nan_kernel(self):
+        self.assertTrue(_any_non_nan_py(np.array([np.nan, np.nan, 2.0])))
+        self.assertFalse(_any_non_nan_py(np.array([np.nan, np.nan])))
+
+    def test_import_does_not_load_numba(self):
+        import subprocess
+        code = ('import sys; sys.path.insert(0, %r); import xlbricks.libs.validation; '
+                'print("numba" in sys.modules)' % _root)
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), 'False')
+
 
 class TestCheckRequired(unittest.TestCase):
     def test_missing_returns_error_string(self):
@@ -106,6 +141,22 @@ class TestCheckArray2d(unittest.TestCase):
         self.assertIsNone(_check_array_2d('data', np.array([[1, 2], [3, 4]])))
         self.assertIsNone(_check_array_2d('data', np.array([['a']])))
 
+    def test_non_ndarray_2d_still_checked(self):
+        self.assertIsNone(_check_array_2d('data', np.matrix([[1, 2]])))
+        out = _check_array_2d('data', np.zeros((0, 3)))
+        self.assertIn('empty', out)
+
+
+class TestValidate(unittest.TestCase):
+    def test_valid_inputs_return_none(self):
+        self.assertIsNone(_validate(('key', _REQUIRED, 'k'), ('data', _ARRAY_2D, np.array([[1.0]]))))
+
+    def test_first_error_returned_with_original_message(self):
+        out = _validate(('key', _REQUIRED, ' nan '), ('data', _ARRAY_2D, None))
+        self.assertEqual(out, _check_required('key', ' nan '))
+        out = _validate(('key', _REQUIRED, 1.5), ('data', _ARRAY_2D, np.array([[]])))
+        self.assertEqual(out, _check_array_2d('data', np.array([[]])))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,6 +5,7 @@
 """
 
 import unittest
+from unittest import mock
 import numpy as np
 import sys
 import os
@@ -38,7 +39,9 @@ try:
         xlb_today,
         xlb_clear_bricks_front,
         xlb_open_brick_explorer,
+        _array2d_args,
     )
+    from xlbricks import xlbfunctions
     XLBFUNCTIONS_AVAILABLE = True
     _import_error = ''
 except ImportError as e:
@@ -110,6 +113,29 @@ class TestXlbBricks(unittest.TestCase):
         self.assertIn(':', out)
 
 
+@unittest.skipUnless(XLBFUNCTIONS_AVAILABLE, "xlbfunctions deps not available: " + _import_error)
+class TestXlbBricksV2(unittest.TestCase):
+    def tearDown(self):
+        xlb_clear_bricks_front()
+
+    def test_pairs_resolved(self):
+        from xlbricks.libs.utility_functions import XLUtils
+        reference = xlb_array(_arr([1.0, 2.0]), persist=False)
+        out = xlbfunctions.xlb_bricks_v2(_arr(['a', reference], [None, 5.0], ['b', 3.0]), persist=False)
+        bricks = XLUtils.get_bricks(np.array([[out]]))
+        self.assertEqual(list(bricks.to_dict()), ['a', 'b'])
+        self.assertEqual(bricks[['a']].value.tolist(), [[1.0, 2.0]])
+        self.assertEqual(bricks[['b']].value.tolist(), [[3.0]])
+
+    def test_wrong_column_count_returns_error(self):
+        out = xlbfunctions.xlb_bricks_v2(_arr(['a', 1.0, 2.0]), persist=False)
+        self.assertTrue(_is_error(out))
+        self.assertIn('two-column', out)
+
+    def test_missing_pairs_returns_error(self):
+        self.assertTrue(_is_error(xlbfunctions.xlb_bricks_v2(None, persist=False)))
+
+
 # --- xlb_array ---
 
 
@@ -144,6 +170,12 @@ class TestXlbList(unittest.TestCase):
         out = xlb_list(data, persist=False)
         self.assertFalse(_is_error(out))
 
+    def test_block_range_flattened_row_major(self):
+        # xlb_list takes m-by-n blocks, which xlwings' ndim=1 conversion would reject
+        from xlbricks.libs.utility_functions import XLUtils
+        out = xlb_list(np.array([[1.0, 2.0], [3.0, 4.0]]), persist=False)
+        self.assertEqual(XLUtils.get_bricks(np.array([[out]])).value, [1.0, 2.0, 3.0, 4.0])
+
 
 # --- xlb_table ---
 
@@ -208,6 +240,60 @@ class TestXlbFlatten(unittest.TestCase):
         self.assertEqual(out.shape[1], 2)
 
 
+@unittest.skipUnless(XLBFUNCTIONS_AVAILABLE, "xlbfunctions deps not available: " + _import_error)
+class TestXlbCached(unittest.TestCase):
+    def setUp(self):
+        xlb_clear_bricks_front()
+
+    def tearDown(self):
+        xlb_clear_bricks_front()
+
+    def test_repeated_reference_served_from_cache(self):
+        reference = np.array([[xlb_array(np.array([[1.0, 2.0]]), persist=False)]])
+        first = xlb_flatten(reference)
+        self.assertEqual(first.tolist(), [[1.0, 2.0]])
+        # The non-persistent source was consumed by the first call; the second comes from the cache
+        self.assertIs(xlb_flatten(reference), first)
+
+    def test_data_ranges_not_cached(self):
+        xlb_flatten(np.array([[1.0, 2.0]]))
+        self.assertEqual(xlbfunctions._XLB_CACHE, {})
+
+    def test_cleared_with_front_stack(self):
+        reference = np.array([[xlb_array(np.array([[1.0]]), persist=False)]])
+        xlb_flatten(reference)
+        self.assertTrue(xlbfunctions._XLB_CACHE)
+        xlb_clear_bricks_front()
+        self.assertEqual(xlbfunctions._XLB_CACHE, {})
+        self.assertEqual(xlbfunctions._XLB_CACHE_ALIASES, {})
+
+    def test_new_counter_evicts_older_results(self):
+        # Both bricks are persisted from the same cell, so they share an alias with increasing counters
+        with mock.patch.object(xlbfunctions.XLUtils, 'active_cell_address', return_value='[Book1]Sheet1!$A$1'):
+            first = np.array([[xlb_array(np.array([[1.0]]))]])
+            xlb_flatten(first)
+            second = np.array([[xlb_array(np.array([[2.0]]))]])
+        self.assertNotEqual(first[0, 0], second[0, 0])
+        self.assertEqual(xlb_flatten(second).tolist(), [[2.0]])
+        self.assertEqual([key[1] for key in xlbfunctions._XLB_CACHE], [second[0, 0]])
+
+    def test_full_cache_emptied(self):
+        reference = np.array([[xlb_array(np.array([[1.0]]), persist=False)]])
+        with mock.patch.object(xlbfunctions, '_XLB_CACHE_SIZE', 0):
+            xlb_flatten(reference)
+        self.assertEqual(len(xlbfunctions._XLB_CACHE), 1)
+        self.assertEqual(len(xlbfunctions._XLB_CACHE_ALIASES), 1)
+
+    def test_errors_not_cached(self):
+        reference = np.array([['missing:0']])
+        with mock.patch.object(xlbfunctions, '_flatten_element', side_effect=KeyError('missing')):
+            self.assertTrue(_is_error(xlb_flatten(reference)))
+        self.assertEqual(xlbfunctions._XLB_CACHE, {})
+
+    def test_alias_not_cached(self):
+        self.assertFalse(getattr(xlb_alias, '__xlb_cached__', False))
+
+
 # --- xlb_alias ---
 
 
@@ -341,6 +427,14 @@ class TestXlbToday(unittest.TestCase):
         self.assertFalse(_is_error(out))
         self.assertIsInstance(out, type(date.today()))
 
+    def test_date_reused_until_midnight(self):
+        from datetime import date
+        with mock.patch.object(xlbfunctions, '_TODAY_CACHE', (date(2000, 1, 1), float('inf'))):
+            self.assertEqual(xlb_today(), date(2000, 1, 1))
+        with mock.patch.object(xlbfunctions, '_TODAY_CACHE', (date(2000, 1, 1), 0.0)):
+            self.assertEqual(xlb_today(), date.today())
+            self.assertGreater(xlbfunctions._TODAY_CACHE[1], 0.0)
+
 
 # --- xlb_clear_bricks_front ---
 
@@ -352,6 +446,17 @@ class TestXlbClearBricksFront(unittest.TestCase):
         self.assertIsNone(out)
 
 
+# --- xlb_session ---
+
+
+@unittest.skipUnless(XLBFUNCTIONS_AVAILABLE, "xlbfunctions deps not available: " + _import_error)
+class TestXlbSession(unittest.TestCase):
+    def test_token_stable_within_server(self):
+        out = xlbfunctions.xlb_session()
+        self.assertIsInstance(out, str)
+        self.assertEqual(xlbfunctions.xlb_session(), out)
+
+
 # --- xlb_open_brick_explorer ---
 
 
@@ -366,6 +471,20 @@ class TestXlbOpenBrickExplorer(unittest.TestCase):
         self.assertTrue(_is_error(out))
 
 
+@unittest.skipUnless(XLBFUNCTIONS_AVAILABLE, "xlbfunctions deps not available: " + _import_error)
+class TestXlbOpenBricksExplorer(unittest.TestCase):
+    def test_reopen_reuses_application(self):
+        try:
+            from PyQt5.QtWidgets import QApplication
+        except ImportError as e:
+            self.skipTest('PyQt5 not available: %s' % e)
+        with mock.patch.object(QApplication, 'exec_', return_value=0) as exec_:
+            self.assertIsNone(xlbfunctions.xlb_open_bricks_explorer())
+            self.assertIsNone(xlbfunctions.xlb_open_bricks_explorer())
+        self.assertEqual(exec_.call_count, 2)
+        self.assertIs(xlbfunctions._qapp(), QApplication.instance())
+
+
 # --- Edge cases: _return_errors decorator ---
 
 
@@ -373,6 +492,33 @@ class TestXlbOpenBrickExplorer(unittest.TestCase):
 class TestReturnErrorsDecorator(unittest.TestCase):
     """Test that exceptions are turned into #XLB ERROR: strings."""
 
+    def test_message_format(self):
+        def fail():
+            raise KeyError('k')
+        self.assertEqual(xlbfunctions._return_errors(fail)(), _ERROR_PREFIX + "KeyError: 'k'")
+
+    def test_repeated_error_reuses_message(self):
+        def fail(value):
+            raise ValueError(value)
+        wrapped = xlbfunctions._return_errors(fail)
+        self.assertIs(wrapped('stale reference'), wrapped('stale ' + 'reference'))
+
+    def test_error_cache_bounded(self):
+        def fail(value):
+            raise ValueError(value)
+        wrapped = xlbfunctions._return_errors(fail)
+        with mock.patch.object(xlbfunctions, '_ERROR_CACHE', dict()):
+            for idx in range(xlbfunctions._ERROR_CACHE_SIZE + 10):
+                wrapped(idx)
+            self.assertEqual(len(xlbfunctions._ERROR_CACHE), xlbfunctions._ERROR_CACHE_SIZE)
+            self.assertNotIn(('ValueError', '0'), xlbfunctions._ERROR_CACHE)
+
+    def test_signature_follows_wrapped_function(self):
+        import inspect
+        self.assertNotIn('__signature__', xlb_table.__dict__)
+        self.assertEqual(list(inspect.signature(xlb_table).parameters),
+                         ['data', 'columns', 'index', 'persist', 'xlapp'])
+
     def test_xlb_brick_invalid_data_type_caught(self):
         # Pass something that will fail inside xl.xlbrick_create (e.g. bad shape)
         out = xlb_brick('k', np.array([[1, 2], [3, 4]]), persist=False)
@@ -382,5 +528,54 @@ class TestReturnErrorsDecorator(unittest.TestCase):
             self.assertIn(':', out)
 
 
+@unittest.skipUnless(XLBFUNCTIONS_AVAILABLE, "xlbfunctions deps not available: " + _import_error)
+class TestArray2dArgs(unittest.TestCase):
+    def test_each_name_registered_as_2d_array(self):
+        registered = []
+
+        def fake_arg(name, convert=None, **kwargs):
+            registered.append((name, convert, kwargs))
+            return lambda f: f
+
+        def sample(a, b):
+            return a, b
+
+        with mock.patch.object(xlbfunctions.xw, 'arg', fake_arg):
+            self.assertIs(_array2d_args('a', 'b')(sample), sample)
+        converter = xlbfunctions._Array2DConverter
+        self.assertEqual(registered, [('b', converter, {'ndim': 2}), ('a', converter, {'ndim': 2})])
+
+    def test_reader_pipeline_reused(self):
+        converter = xlbfunctions._Array2DConverter
+        pipeline = converter.reader({'convert': converter, 'ndim': 2})
+        self.assertIs(converter.reader({'convert': converter, 'ndim': 2}), pipeline)
+        self.assertIsNot(converter.reader({'convert': converter, 'ndim': 1}), pipeline)
+        self.assertIsInstance(pipeline[-1], converter.FromValueStage)
+
+
+@unittest.skipUnless(XLBFUNCTIONS_AVAILABLE, "xlbfunctions deps not available: " + _import_error)
+class TestLazyUiImports(unittest.TestCase):
+    def test_import_does_not_load_qt(self):
+        import subprocess
+        code = ('import sys; sys.path.insert(0, %r); import xlbricks.xlbfunctions; '
+                'print(any(m.startswith(("PyQt5", "xlbricks.ui")) for m in sys.modules))' % _root)
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), 'False')
+
+
+@unittest.skipUnless(XLBFUNCTIONS_AVAILABLE, "xlbfunctions deps not available: " + _import_error)
+class TestImagePath(unittest.TestCase):
+    def test_existing_icon_resolved_once(self):
+        xlbfunctions._get_image_path.cache_clear()
+        path = xlbfunctions._get_image_path('stars.png')
+        self.assertTrue(os.path.isfile(path))
+        with mock.patch.object(xlbfunctions.osp, 'isfile') as isfile:
+            self.assertEqual(xlbfunctions._get_image_path('stars.png'), path)
+        isfile.assert_not_called()
+
+    def test_missing_icon_returns_empty(self):
+        self.assertEqual(xlbfunctions._get_image_path('no_such_icon.png'), '')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+"""
+    Author: julij.jegorov
+    Date: 15/02/2026
+    Description: Unit tests for XLBrick / XLBricks data structures and QuantLib conversion.
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_xlbricks = os.path.dirname(_here)
+_root = os.path.dirname(_xlbricks)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+# Brick structures import QuantLib; skip module if unavailable
+try:
+    import QuantLib as ql
+    from xlbricks.libs.xlbricks import XLBrick, XLBricks
+    XLBRICKS_AVAILABLE = True
+    _import_error = ''
+except ImportError as e:
+    XLBRICKS_AVAILABLE = False
+    _import_error = str(e)
+
+
+@unittest.skipUnless(XLBRICKS_AVAILABLE, "xlbricks deps not available: " + _import_error)
+class TestXLBrickToQuantlibDict(unittest.TestCase):
+    def test_single_float_cell_unwrapped_to_int(self):
+        out = XLBrick(None, np.array([[3.0]])).to_quantlib_dict()
+        self.assertEqual(out, 3)
+        self.assertIsInstance(out, int)
+
+    def test_single_string_cell_unwrapped(self):
+        out = XLBrick(None, np.array([['abc']])).to_quantlib_dict()
+        self.assertEqual(out, 'abc')
+        self.assertIsInstance(out, str)
+
+    def test_single_object_cell_unwrapped(self):
+        out = XLBrick(None, np.array([['ql.Annual']], dtype=object)).to_quantlib_dict()
+        self.assertEqual(out, ql.Annual)
+
+    def test_quantlib_expression_evaluated_per_cell(self):
+        out = XLBrick(None, np.array([['ql.SimpleQuote(1.5)', 'ql.SimpleQuote(1.5)']], dtype=object)).to_quantlib_dict()
+        self.assertEqual(out[0][0].value(), 1.5)
+        self.assertIsNot(out[0][0], out[0][1])
+
+    def test_quantlib_expression_has_no_builtins(self):
+        with self.assertRaises(NameError):
+            XLBrick(None, np.array([['ql.Date(1, 1, __import__("os").getpid())']], dtype=object)).to_quantlib_dict()
+
+    def test_string_booleans_cast(self):
+        out = XLBrick(None, np.array([['TRUE', 'false', 'x']])).to_quantlib_dict()
+        self.assertEqual(out, [[True, False, 'x']])
+
+    def test_mixed_floats_keep_fractions(self):
+        out = XLBrick(None, np.array([[1.0, 2.5]])).to_quantlib_dict()
+        self.assertEqual(out, [[1, 2.5]])
+
+    def test_keyed_brick_returns_mapping(self):
+        out = XLBrick('k', np.array([[1.0, 2.0]])).to_quantlib_dict()
+        self.assertEqual(dict(out), {'k': [[1, 2]]})
+
+    def test_quantlib_value_passthrough(self):
+        date = ql.Date(1, 1, 2026)
+        self.assertIs(XLBrick(None, date).to_quantlib_dict(), date)
+
+
+@unittest.skipUnless(XLBRICKS_AVAILABLE, "xlbricks deps not available: " + _import_error)
+class TestXLBricksToQuantlibDict(unittest.TestCase):
+    def test_nested_keys_cast_as_scalars(self):
+        inner = XLBricks('ql.Annual')
+        inner['true'] = XLBrick(None, np.array([[2.0]]))
+        outer = XLBricks()
+        outer[1.0] = inner
+        out = outer.to_quantlib_dict()
+        self.assertEqual(list(out.keys()), [1])
+        self.assertIsInstance(list(out.keys())[0], int)
+        self.assertEqual(dict(out[1]), {ql.Annual: {True: 2}})
+
+
+if __name__ == '__main__':
+    unittest.main()
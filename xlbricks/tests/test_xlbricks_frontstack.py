@@ -0,0 +1,84 @@
+"""
+    Author: julij.jegorov
+    Date: 15/02/2026
+    Description: Unit tests for XLBricksFrontStack and the add/delete stack helpers.
+"""
+
+import unittest
+import sys
+import os
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_xlbricks = os.path.dirname(_here)
+_root = os.path.dirname(_xlbricks)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+# Importing through the package pulls in its heavy deps; skip module if unavailable
+try:
+    from xlbricks.libs.xlbricks_front import XLBricksFront
+    from xlbricks.libs.xlbricks_frontstack import (
+        XLBricksFrontStack,
+        add_bricks_to_front_stack,
+        delete_bricks_from_front_stack,
+    )
+    FRONTSTACK_AVAILABLE = True
+    _import_error = ''
+except ImportError as e:
+    FRONTSTACK_AVAILABLE = False
+    _import_error = str(e)
+
+
+@unittest.skipUnless(FRONTSTACK_AVAILABLE, "front stack deps not available: " + _import_error)
+class TestXLBricksFrontStack(unittest.TestCase):
+    def setUp(self):
+        XLBricksFrontStack().clear()
+
+    def tearDown(self):
+        XLBricksFrontStack().clear()
+
+    def test_singleton_shares_state(self):
+        XLBricksFrontStack()['a'] = 1
+        self.assertIn('a', XLBricksFrontStack())
+
+    def test_add_increments_counter(self):
+        add_bricks_to_front_stack(XLBricksFront('A1', None))
+        second = XLBricksFront('A1', None)
+        add_bricks_to_front_stack(second)
+        self.assertEqual(second.counter, 1)
+        self.assertIs(XLBricksFrontStack()['A1'], second)
+
+    def test_delete_only_non_persistent(self):
+        persistent = XLBricksFront('A1', None, persist=True)
+        transient = XLBricksFront(None, None, persist=False)
+        add_bricks_to_front_stack(persistent)
+        add_bricks_to_front_stack(transient)
+        delete_bricks_from_front_stack(persistent)
+        delete_bricks_from_front_stack(transient)
+        self.assertIn('A1', XLBricksFrontStack())
+        self.assertNotIn(transient.bricks_name, XLBricksFrontStack())
+
+    def test_clear_does_not_mutate_old_dict(self):
+        XLBricksFrontStack()['a'] = 1
+        old = XLBricksFrontStack().front_stack
+        XLBricksFrontStack().clear()
+        self.assertNotIn('a', XLBricksFrontStack())
+        self.assertIn('a', old)
+
+    def test_version_bumped_on_changes(self):
+        stack = XLBricksFrontStack()
+        transient = XLBricksFront(None, None, persist=False)
+        versions = [stack.version]
+        add_bricks_to_front_stack(transient)
+        versions.append(stack.version)
+        delete_bricks_from_front_stack(transient)
+        versions.append(stack.version)
+        delete_bricks_from_front_stack(transient)
+        versions.append(stack.version)
+        stack.clear()
+        versions.append(stack.version)
+        self.assertEqual([v - versions[0] for v in versions], [0, 1, 2, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
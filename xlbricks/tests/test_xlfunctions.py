@@ -0,0 +1,261 @@
+"""
+    Author: julij.jegorov
+    Date: 15/02/2026
+    Description: Unit tests for xlfunctions (brick creation and user-defined functions, no Excel).
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_xlbricks = os.path.dirname(_here)
+_root = os.path.dirname(_xlbricks)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+# xlfunctions pulls in pandas and the brick structures; skip if unavailable
+try:
+    from xlbricks.libs import xlfunctions
+    from xlbricks.libs.utility_functions import XLUtils
+    from xlbricks.libs.xlbricks import XLBrick, XLBricks
+    from xlbricks.libs.xlbricks_front import XLBricksFront
+    from xlbricks.libs.xlbricks_frontstack import XLBricksFrontStack, add_bricks_to_front_stack
+    XLFUNCTIONS_AVAILABLE = True
+    _import_error = ''
+except ImportError as e:
+    XLFUNCTIONS_AVAILABLE = False
+    _import_error = str(e)
+
+
+def _resolve(reference):
+    """Look up the bricks behind a reference string returned by an xlfunctions call."""
+    return XLUtils.get_bricks(np.array([[reference]]))
+
+
+class _NoComApp(object):
+    """Application stand-in that fails if the caller's address is requested."""
+
+    @property
+    def Caller(self):
+        raise AssertionError('active cell address requested')
+
+
+@unittest.skipUnless(XLFUNCTIONS_AVAILABLE, "xlfunctions deps not available: " + _import_error)
+class TestCreateBricksFront(unittest.TestCase):
+    def test_address_skipped_when_not_persisted(self):
+        front = xlfunctions.create_bricks_front(XLBrick(None, 1.0), _NoComApp(), False)
+        self.assertFalse(front.persist)
+
+    def test_address_read_when_persisted(self):
+        with self.assertRaises(AssertionError):
+            xlfunctions.create_bricks_front(XLBrick(None, 1.0), _NoComApp(), True)
+
+
+@unittest.skipUnless(XLFUNCTIONS_AVAILABLE, "xlfunctions deps not available: " + _import_error)
+class TestXLBricksCreate(unittest.TestCase):
+    def tearDown(self):
+        XLBricksFrontStack().clear()
+
+    def test_same_reference_under_two_keys(self):
+        front = XLBricksFront(None, XLBrick(None, 3.0), False)
+        add_bricks_to_front_stack(front)
+        reference = np.array([[front.bricks_full_name]])
+
+        bricks = _resolve(xlfunctions.xlbricks_create('a', reference, 'b', reference, persist=False))
+        self.assertEqual(bricks.to_dict(), {'a': 3.0, 'b': 3.0})
+
+    def test_brick_without_key_skipped(self):
+        bricks = _resolve(xlfunctions.xlbricks_create('a', np.array([[1.0]]), None, np.array([[2.0]]), persist=False))
+        self.assertEqual(list(bricks.to_dict()), ['a'])
+
+
+@unittest.skipUnless(XLFUNCTIONS_AVAILABLE, "xlfunctions deps not available: " + _import_error)
+class TestTableCreate(unittest.TestCase):
+    def tearDown(self):
+        XLBricksFrontStack().clear()
+
+    def test_headers_and_index(self):
+        data = np.array([[1.0, 2.0], [3.0, 4.0]])
+        reference = xlfunctions.table_create(data, np.array([['a', 'b']]), np.array([['x'], ['y']]), False)
+        table = _resolve(reference).value
+        self.assertEqual(list(table.columns), ['a', 'b'])
+        self.assertEqual(list(table.index), ['x', 'y'])
+        self.assertEqual(table.loc['y', 'a'], 3.0)
+
+    def test_source_array_not_shared(self):
+        data = np.array([[1.0, 2.0], [3.0, 4.0]])
+        table = _resolve(xlfunctions.table_create(data, None, None, False)).value
+        data[0, 0] = 99.0
+        self.assertEqual(table.iloc[0, 0], 1.0)
+
+    def test_column_major_source_not_shared(self):
+        data = np.asfortranarray([[1.0, 2.0], [3.0, 4.0]])
+        table = _resolve(xlfunctions.table_create(data, None, None, False)).value
+        data[0, 0] = 99.0
+        self.assertEqual(table.iloc[0, 0], 1.0)
+
+
+@unittest.skipUnless(XLFUNCTIONS_AVAILABLE, "xlfunctions deps not available: " + _import_error)
+class TestGridCreate(unittest.TestCase):
+    def tearDown(self):
+        XLBricksFrontStack().clear()
+
+    def test_string_grid_split_on_keys(self):
+        data = np.array([
+            ['a', '1', '2'],
+            ['nan', '3', '4'],
+            ['b', 'x', 'nan'],
+        ])
+        bricks = _resolve(xlfunctions.grid_create(data, False))
+        self.assertEqual(bricks[['a']].value.tolist(), [[1.0, 2.0], [3.0, 4.0]])
+        self.assertEqual(bricks[['b']].value.tolist(), [['x']])
+
+    def test_object_grid_single_key(self):
+        data = np.array([['a', 1.0], [None, 2.0]], dtype=object)
+        bricks = _resolve(xlfunctions.grid_create(data, False))
+        self.assertEqual(bricks[['a']].value.tolist(), [[1.0], [2.0]])
+
+    def test_numeric_keys(self):
+        data = np.array([[1.0, 5.0], [np.nan, 6.0], [2.0, 7.0]])
+        bricks = _resolve(xlfunctions.grid_create(data, False))
+        self.assertEqual(sorted(bricks.to_dict()), [1.0, 2.0])
+
+
+@unittest.skipUnless(XLFUNCTIONS_AVAILABLE, "xlfunctions deps not available: " + _import_error)
+class TestLookupElement(unittest.TestCase):
+    def tearDown(self):
+        XLBricksFrontStack().clear()
+
+    def test_path_whitespace_ignored(self):
+        inner = XLBricks(None, {'child': XLBrick(None, 7.0)})
+        source = XLBricksFront('source', XLBricks(None, {'parent': inner}), True)
+        add_bricks_to_front_stack(source)
+
+        reference = xlfunctions.lookup_element(np.array([[source.bricks_full_name]]), ' parent / child\n', False)
+        self.assertEqual(_resolve(reference).value, 7.0)
+
+
+@unittest.skipUnless(XLFUNCTIONS_AVAILABLE, "xlfunctions deps not available: " + _import_error)
+class TestFlattenBricks(unittest.TestCase):
+    def tearDown(self):
+        XLBricksFrontStack().clear()
+
+    def _flatten(self, value):
+        front = XLBricksFront('flat', XLBrick(None, value), True)
+        add_bricks_to_front_stack(front)
+        return xlfunctions.flatten_bricks(np.array([[front.bricks_full_name]]))
+
+    def test_2d_array_returned_as_is(self):
+        data = np.array([[1.0, 2.0], [3.0, 4.0]])
+        self.assertIs(self._flatten(data), data)
+
+    def test_list_becomes_column(self):
+        self.assertEqual(self._flatten([1, 2, 3]).shape, (3, 1))
+
+    def test_scalar_becomes_single_cell(self):
+        out = self._flatten('x')
+        self.assertEqual(out.shape, (1, 1))
+        self.assertEqual(out[0, 0], 'x')
+
+
+@unittest.skipUnless(XLFUNCTIONS_AVAILABLE, "xlfunctions deps not available: " + _import_error)
+class TestFuncLineSanitize(unittest.TestCase):
+    def test_strings_keep_indentation(self):
+        self.assertEqual(xlfunctions._func_line_sanitize('    return 1'), '    return 1')
+
+    def test_empty_values(self):
+        for cell in ('', '   ', 'nan', ' NaN ', None, float('nan'), np.float64('nan')):
+            self.assertEqual(xlfunctions._func_line_sanitize(cell), '')
+
+    def test_non_string_converted(self):
+        self.assertEqual(xlfunctions._func_line_sanitize(1.5), '1.5')
+
+
+@unittest.skipUnless(XLFUNCTIONS_AVAILABLE, "xlfunctions deps not available: " + _import_error)
+class TestCreateFunctionObjects(unittest.TestCase):
+    def tearDown(self):
+        XLBricksFrontStack().clear()
+
+    def test_blocks_split_on_def_and_import(self):
+        funcs = np.array([
+            ['import math'],
+            ['def f(a):'],
+            ['    return math.sqrt(a)'],
+            ['nan'],
+            ['def g():'],
+            ['    return 2'],
+        ])
+        bricks = _resolve(xlfunctions.create_function_objects(funcs, False))
+        self.assertEqual(bricks[['f']].value(16.0), 4.0)
+        self.assertEqual(bricks[['g']].value(), 2)
+
+    def test_empty_cells_sanitized(self):
+        funcs = np.array([['def f():'], [None], ['    return 1']], dtype=object)
+        bricks = _resolve(xlfunctions.create_function_objects(funcs, False))
+        self.assertEqual(bricks[['f']].value(), 1)
+
+    def test_single_cell_function(self):
+        funcs = np.array([['import math']])
+        bricks = _resolve(xlfunctions.create_function_objects(funcs, False))
+        self.assertEqual(bricks[['math']].value.__name__, 'math')
+
+
+@unittest.skipUnless(XLFUNCTIONS_AVAILABLE, "xlfunctions deps not available: " + _import_error)
+class TestMergeElements(unittest.TestCase):
+    def tearDown(self):
+        XLBricksFrontStack().clear()
+
+    def test_later_bricks_win_on_shared_keys(self):
+        first = XLBricksFront('first', XLBricks(None, {'a': XLBrick(None, 1.0), 'b': XLBrick(None, 2.0)}), True)
+        second = XLBricksFront('second', XLBricks(None, {'b': XLBrick(None, 20.0), 'c': XLBrick(None, 30.0)}), True)
+        add_bricks_to_front_stack(first)
+        add_bricks_to_front_stack(second)
+
+        reference = xlfunctions.merge_elements(np.array([[first.bricks_full_name]]),
+                                               np.array([[second.bricks_full_name]]), persist=False)
+        self.assertEqual(_resolve(reference).to_dict(), {'a': 1.0, 'b': 20.0, 'c': 30.0})
+        self.assertEqual(first.xlbricks.to_dict(), {'a': 1.0, 'b': 2.0})
+
+
+@unittest.skipUnless(XLFUNCTIONS_AVAILABLE, "xlfunctions deps not available: " + _import_error)
+class TestReplaceElements(unittest.TestCase):
+    def tearDown(self):
+        XLBricksFrontStack().clear()
+
+    def test_source_bricks_untouched(self):
+        inner = XLBricks(None, {'x': XLBrick(None, 1.0), 'y': XLBrick(None, 2.0)})
+        source = XLBricksFront('source', XLBricks(None, {'a': inner, 'b': XLBrick(None, 3.0)}), True)
+        add_bricks_to_front_stack(source)
+
+        xlfunctions.replace_elements(np.array([[source.bricks_full_name]]), 'a/x', np.array([[9.0]]))
+        self.assertEqual(source.xlbricks.to_dict(), {'a': {'x': 1.0, 'y': 2.0}, 'b': 3.0})
+        self.assertIs(source.xlbricks[['a']], inner)
+
+    def test_replacement_values_applied(self):
+        source = XLBricksFront('source', XLBricks(None, {'a': XLBrick(None, 1.0), 'b': XLBrick(None, 2.0)}), True)
+        add_bricks_to_front_stack(source)
+
+        reference = xlfunctions.replace_elements(np.array([[source.bricks_full_name]]),
+                                                 'a', np.array([[5.0]]), 'b', np.array([['x']]))
+        bricks = _resolve(reference)
+        self.assertEqual(bricks[['a']].value.tolist(), [[5.0]])
+        self.assertEqual(bricks[['b']].value.tolist(), [['x']])
+
+
+@unittest.skipUnless(XLFUNCTIONS_AVAILABLE, "xlfunctions deps not available: " + _import_error)
+class TestGetContextObject(unittest.TestCase):
+    def test_class_resolved_and_cached(self):
+        from collections import OrderedDict
+        self.assertIs(xlfunctions.get_context_object('OrderedDict', 'collections'), OrderedDict)
+        self.assertIs(xlfunctions._CONTEXT_CLASS_CACHE[('collections', 'OrderedDict')], OrderedDict)
+
+    def test_missing_class_raises(self):
+        with self.assertRaises(AttributeError):
+            xlfunctions.get_context_object('NoSuchClass', 'collections')
+        self.assertNotIn(('collections', 'NoSuchClass'), xlfunctions._CONTEXT_CLASS_CACHE)
+
+
+if __name__ == '__main__':
+    unittest.main()
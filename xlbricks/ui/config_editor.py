@@ -5,6 +5,7 @@
                  loaded from Excel (e.g. XLBricks config editor / Wizard).
 """
 
+import copy
 import json
 import os
 import os.path as osp
@@ -16,8 +17,7 @@ from PyQt5.QtWidgets import (
     QFormLayout,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QFileDialog,
     QMessageBox,
@@ -27,6 +27,23 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 
+# Raw parsed config per path: path -> (st_mtime_ns, st_size, dict); reused while the file is unchanged
+_CONFIG_CACHE = dict()
+
+# Configs with more CONTEXT entries than this are written without indentation
+_COMPACT_CONTEXT_SIZE = 100
+
+
+def _directory_dialog_options():
+    """Build QFileDialog options for the folder pickers.
+    
+    Skips per-folder icon lookups (slow on network drives); XLBRICKS_NATIVE_DIALOG=0 switches to the Qt dialog.
+    """
+    options = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.ShowDirsOnly
+    if os.environ.get('XLBRICKS_NATIVE_DIALOG') == '0':
+        options |= QFileDialog.DontUseNativeDialog
+    return options
+
 
 def get_default_config_path():
     """Get the default location of the xlbricks configuration file.
@@ -42,13 +59,25 @@ def load_config(path):
     if not path or not osp.isfile(path):
         return _default_config()
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return _normalize_config(data)
+        return _normalize_config(_read_raw_config(path))
     except Exception:
         return _default_config()
 
 
+def _read_raw_config(path):
+    """Parse the JSON config file without normalizing it.
+    
+    Reuses the previous parse while the file's mtime and size are unchanged; returns a private copy.
+    """
+    st = os.stat(path)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        cached = _CONFIG_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(cached[2])
+
+
 def _default_config():
     """Return default configuration structure.
     
@@ -77,10 +106,112 @@ def _normalize_config(data):
 def save_config(path, data):
     """Write configuration to a JSON file.
     
-    Saves with proper formatting and UTF-8 encoding.
+    Saves indented with UTF-8 encoding; large CONTEXT maps are written compactly to keep the file small.
     """
+    if len(data.get('CONTEXT', {})) > _COMPACT_CONTEXT_SIZE:
+        layout = dict(separators=(',', ':'))
+    else:
+        layout = dict(indent=4)
     with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+        json.dump(data, f, ensure_ascii=False, **layout)
+    _CONFIG_CACHE.pop(path, None)
+
+
+class _RowsTableModel(QtCore.QAbstractTableModel):
+    """Editable table model over a plain list of string rows.
+    
+    Subclasses set HEADERS; each row is a list with one string per header.
+    """
+
+    HEADERS = ()
+
+    def __init__(self, rows=None, parent=None):
+        super(_RowsTableModel, self).__init__(parent)
+        self._rows = [list(row) for row in rows] if rows else []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Return the number of rows (none below a valid parent, as this is a flat table)."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Return the number of columns, one per header."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Provide column titles and 1-based row numbers."""
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section] if section < len(self.HEADERS) else None
+        return section + 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the cell text for display and editing."""
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Store edited cell text."""
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = value if value is not None else ''
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        """Mark every cell as editable."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEditable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def insertRows(self, row, count, parent=QtCore.QModelIndex()):
+        """Insert empty rows before position row."""
+        if count <= 0 or row < 0 or row > len(self._rows):
+            return False
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._rows[row:row] = [[''] * len(self.HEADERS) for _ in range(count)]
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QtCore.QModelIndex()):
+        """Remove count rows starting at position row."""
+        if count <= 0 or row < 0 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def append_row(self, values=None):
+        """Add a row at the end, empty unless values are given."""
+        row = len(self._rows)
+        self.insertRows(row, 1)
+        if values:
+            self._rows[row] = list(values)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def set_rows(self, rows):
+        """Replace all rows in one model reset."""
+        self.beginResetModel()
+        self._rows = [list(row) for row in rows]
+        self.endResetModel()
+
+    def rows(self):
+        """Return the rows as stored (lists of cell strings)."""
+        return self._rows
+
+
+class PathListModel(_RowsTableModel):
+    """PYTHONPATH entries, one path per row."""
+
+    HEADERS = ('Path',)
+
+
+class ContextModel(_RowsTableModel):
+    """CONTEXT entries as (context name, module path) rows."""
+
+    HEADERS = ('Context name', 'Module path')
 
 
 class ConfigEditorDialog(QDialog):
@@ -127,9 +258,9 @@ class ConfigEditorDialog(QDialog):
         grp_path = QGroupBox('PYTHONPATH')
         grp_path.setToolTip('Paths added to Python when running from Excel. One path per row.')
         path_layout = QVBoxLayout(grp_path)
-        self._path_table = QTableWidget()
-        self._path_table.setColumnCount(1)
-        self._path_table.setHorizontalHeaderLabels(['Path'])
+        self._path_model = PathListModel(parent=self)
+        self._path_table = QTableView()
+        self._path_table.setModel(self._path_model)
         self._path_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self._path_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self._path_table.setMinimumHeight(100)
@@ -152,9 +283,9 @@ class ConfigEditorDialog(QDialog):
         grp_context = QGroupBox('Context')
         grp_context.setToolTip('Context name → module path. Used to resolve context objects.')
         ctx_layout = QVBoxLayout(grp_context)
-        self._context_table = QTableWidget()
-        self._context_table.setColumnCount(2)
-        self._context_table.setHorizontalHeaderLabels(['Context name', 'Module path'])
+        self._context_model = ContextModel(parent=self)
+        self._context_table = QTableView()
+        self._context_table.setModel(self._context_model)
         self._context_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
         self._context_table.setColumnWidth(0, 180)
         self._context_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
@@ -198,89 +329,60 @@ class ConfigEditorDialog(QDialog):
             self,
             'Select XLBricks applications folder',
             self._apps_path_edit.text() or os.path.expanduser('~'),
+            options=_directory_dialog_options(),
         )
         if path:
             self._apps_path_edit.setText(path)
 
     def _add_context_row(self):
         """Add a new empty row to the context mapping table."""
-        row = self._context_table.rowCount()
-        self._context_table.insertRow(row)
-        self._context_table.setItem(row, 0, QTableWidgetItem(''))
-        self._context_table.setItem(row, 1, QTableWidgetItem(''))
+        self._context_model.append_row()
 
     def _remove_context_row(self):
         """Delete the selected row from the context table."""
-        row = self._context_table.currentRow()
+        row = self._context_table.currentIndex().row()
         if row >= 0:
-            self._context_table.removeRow(row)
+            self._context_model.removeRows(row, 1)
 
     def _add_path_row(self):
         """Add a new empty row to the PYTHONPATH table."""
-        row = self._path_table.rowCount()
-        self._path_table.insertRow(row)
-        self._path_table.setItem(row, 0, QTableWidgetItem(''))
+        self._path_model.append_row()
 
     def _browse_path_row(self):
         """Open a folder picker and add the selected path to PYTHONPATH."""
-        path = QFileDialog.getExistingDirectory(self, 'Select folder to add to PYTHONPATH')
+        path = QFileDialog.getExistingDirectory(self, 'Select folder to add to PYTHONPATH',
+                                                options=_directory_dialog_options())
         if path:
-            row = self._path_table.rowCount()
-            self._path_table.insertRow(row)
-            self._path_table.setItem(row, 0, QTableWidgetItem(path))
+            self._path_model.append_row([path])
 
     def _remove_path_row(self):
         """Delete the selected row from the PYTHONPATH table."""
-        row = self._path_table.currentRow()
+        row = self._path_table.currentIndex().row()
         if row >= 0:
-            self._path_table.removeRow(row)
+            self._path_model.removeRows(row, 1)
 
     def _load_into_ui(self):
         """Populate UI fields with values from the config file."""
         data = load_config(self._config_path)
         self._apps_path_edit.setText(data.get('APPS_PATH', ''))
         path_str = data.get('PYTHONPATH', '')
-        # Support both newline and semicolon separation
-        if ';' in path_str and '\n' not in path_str:
-            paths = [p.strip() for p in path_str.split(';') if p.strip()]
-        else:
-            paths = [p.strip() for p in path_str.replace(';', '\n').splitlines() if p.strip()]
-        self._path_table.setRowCount(0)
-        for p in paths:
-            row = self._path_table.rowCount()
-            self._path_table.insertRow(row)
-            self._path_table.setItem(row, 0, QTableWidgetItem(p))
+        # Saved with os.pathsep; also accept semicolon- and newline-separated values
+        paths = [p.strip() for p in path_str.replace(';', os.pathsep).replace('\n', os.pathsep).split(os.pathsep)
+                 if p.strip()]
+        self._path_model.set_rows([[p] for p in paths])
         ctx = data.get('CONTEXT', {})
-        self._context_table.setRowCount(0)
-        for name, mod in ctx.items():
-            row = self._context_table.rowCount()
-            self._context_table.insertRow(row)
-            self._context_table.setItem(row, 0, QTableWidgetItem(name))
-            self._context_table.setItem(row, 1, QTableWidgetItem(mod))
+        self._context_model.set_rows([[name, mod] for name, mod in ctx.items()])
 
     def _collect_from_ui(self):
         """Gather all values from UI fields into a config dictionary.
         
         Prepares data for saving to the config file.
         """
-        paths = []
-        for r in range(self._path_table.rowCount()):
-            item = self._path_table.item(r, 0)
-            p = (item.text() if item else '').strip()
-            if p:
-                paths.append(p)
-        path_sep = os.pathsep
-        ctx = {}
-        for r in range(self._context_table.rowCount()):
-            name_item = self._context_table.item(r, 0)
-            mod_item = self._context_table.item(r, 1)
-            name = (name_item.text() if name_item else '').strip()
-            mod = (mod_item.text() if mod_item else '').strip()
-            if name:
-                ctx[name] = mod
+        paths = [path for path in (row[0].strip() for row in self._path_model.rows()) if path]
+        ctx = {name.strip(): mod.strip() for name, mod in self._context_model.rows() if name.strip()}
         return {
             'APPS_PATH': self._apps_path_edit.text().strip(),
-            'PYTHONPATH': path_sep.join(paths),
+            'PYTHONPATH': os.pathsep.join(paths),
             'CONTEXT': ctx,
         }
 
@@ -290,8 +392,7 @@ class ConfigEditorDialog(QDialog):
             existing = {}
             if osp.isfile(self._config_path):
                 try:
-                    with open(self._config_path, 'r', encoding='utf-8') as f:
-                        existing = json.load(f)
+                    existing = _read_raw_config(self._config_path)
                 except Exception:
                     pass
             data = self._collect_from_ui()
@@ -14,6 +14,9 @@ from xlbricks.libs.xlbricks_frontstack import XLBricksFrontStack
 from xlbricks.ui.pandas_model import PandasModel
 from xlbricks.ui.tree_model import DictionaryTreeModel, node_structure_from_dict
 
+# Rows of a DataFrame shown in the table view
+_PREVIEW_ROWS = 25
+
 
 class Singleton(object):
     """Ensures only one instance of a class exists.
@@ -39,6 +42,8 @@ class ExplorerTreeView(QTreeView):
         super(QTreeView, self).__init__()
         self.setHeaderHidden(True)
         self.setModel(model)
+        # Front stack version shown by the tree; None until the first refresh
+        self._last_version = None
 
     def keyPressEvent(self, event):
             super().keyPressEvent(event)
@@ -56,9 +61,20 @@ class ExplorerTreeView(QTreeView):
                 super().keyPressEvent(event)
 
     def refresh(self):
-        """Reload the tree view with current brick data from memory."""
-        model = DictionaryTreeModel(node_structure_from_dict(XLBricksFrontStack().to_dict()))
-        self.setModel(model)
+        """Reload the tree view with current brick data from memory.
+        
+        Does nothing if the front stack has not changed since the last refresh.
+        """
+        front_stack = XLBricksFrontStack()
+        model = self.model()
+        if isinstance(model, DictionaryTreeModel) and front_stack.version == self._last_version:
+            return
+        data = front_stack.to_dict()
+        if isinstance(model, DictionaryTreeModel):
+            model.reset_from_dict(data)
+        else:
+            self.setModel(DictionaryTreeModel(node_structure_from_dict(data)))
+        self._last_version = front_stack.version
 
 
 class ExplorerTableView(QTableView):
@@ -69,6 +85,9 @@ class ExplorerTableView(QTableView):
     
     def __init__(self):
         super(QTableView, self).__init__()
+        # One model for the view's lifetime; refresh() swaps its data instead of building a new model
+        self._model = PandasModel(pd.DataFrame())
+        self.setModel(self._model)
 
     def refresh(self, data=None):
         """Update the table view with new data.
@@ -76,14 +95,11 @@ class ExplorerTableView(QTableView):
         Accepts DataFrames, arrays, or scalar values.
         """
         if data is None:
-            df = pd.DataFrame()
-        elif isinstance(data, pd.DataFrame):
-            df = data
-        elif isinstance(data, np.ndarray):
-            df = pd.DataFrame(data)
-        else:
-            df = pd.DataFrame(np.array([data]))
-        self.setModel(PandasModel(df))
+            data = pd.DataFrame()
+        elif not isinstance(data, (pd.DataFrame, np.ndarray)):
+            data = np.array([data])
+        # PandasModel reads arrays directly, so they are not wrapped in a DataFrame first
+        self._model.set_dataframe(data)
 
 
 class Explorer(QWidget):
@@ -123,11 +139,12 @@ class Explorer(QWidget):
                 self._table_view.refresh(None)
                 return
             data_frame = node.value
-            # Make a defensive copy to isolate from Excel COM thread
+            # The table model is read-only, so isolating it from the Excel COM thread only needs the shown
+            # rows frozen in shape: a shallow copy of the preview slice, not a deep copy of the whole frame
             if isinstance(data_frame, pd.DataFrame):
-                data_frame = data_frame.copy(deep=True)
+                data_frame = data_frame.iloc[:_PREVIEW_ROWS].copy(deep=False)
             elif isinstance(data_frame, np.ndarray):
-                data_frame = np.copy(data_frame)
+                data_frame = data_frame[:_PREVIEW_ROWS].copy() if data_frame.ndim else data_frame.copy()
             self._table_view.refresh(data_frame)
         except Exception as e:
             print(f"Error loading data frame: {e}")
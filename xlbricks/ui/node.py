@@ -11,6 +11,8 @@ class Node(object):
     Represents a single item in a tree with name, value, parent, and children.
     """
 
+    __slots__ = ('_name', '_value', '_parent', '_children', '_row')
+
     def __init__(self, name, parent=None):
         """Create a new tree node.
         
@@ -20,11 +22,13 @@ class Node(object):
         self._parent = parent
         self._children = []
         self._value = None
+        self._row = None
         if parent is not None:
             parent.add_child(self)
 
     def add_child(self, child):
-        """Add a child node to this node."""
+        """Add a child node to this node, recording its position for row()."""
+        child._row = len(self._children)
         self._children.append(child)
 
     @property
@@ -43,6 +47,11 @@ class Node(object):
     def value(self, value):
         self._value = value
 
+    @property
+    def children(self):
+        """The list of child nodes (read directly by the tree model; do not modify)."""
+        return self._children
+
     def child(self, row):
         """Get the child node at the specified index."""
         return self._children[row]
@@ -56,27 +65,27 @@ class Node(object):
         return self._parent
 
     def row(self):
-        """Get this node's position in its parent's children list."""
-        if self._parent is not None:
-            return self._parent._children.index(self)
+        """Get this node's position in its parent's children list (None for the root)."""
+        return self._row
 
     def data(self, column):
         """Get data for display in a specific column.
         
         Column 0 returns name, column 1 returns value.
         """
-        if column is 0:
-            return self.name
-        elif column is 1:
-            return self.value
+        if column == 0:
+            return self._name
+        if column == 1:
+            return self._value
+        return None
 
     def set_data(self, column, value):
         """Set data for a specific column.
         
         Column 0 sets name, column 1 sets value.
         """
-        if column is 0:
-            self.name = value
-        if column is 1:
-            self.value = value
+        if column == 0:
+            self._name = value
+        elif column == 1:
+            self._value = value
 
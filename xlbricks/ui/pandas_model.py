@@ -8,6 +8,10 @@ from PyQt5 import QtCore
 import pandas as pd
 import numpy as np
 
+# Alignment answers are the same for every cell/header; build the variants once
+_HEADER_ALIGNMENT = QtCore.QVariant(QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter)
+_CELL_ALIGNMENT = QtCore.QVariant(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+
 
 class PandasModel(QtCore.QAbstractTableModel):
     """Qt model adapter for displaying pandas DataFrames in table views.
@@ -16,12 +20,43 @@ class PandasModel(QtCore.QAbstractTableModel):
     """
 
     def __init__(self, df=pd.DataFrame(), parent=None):
-        """Initialize the model with a DataFrame.
+        """Initialize the model with a DataFrame or a numpy array.
         
-        Defaults to an empty DataFrame if none provided.
+        Defaults to an empty DataFrame if none provided; arrays are shown with positional headers.
         """
         QtCore.QAbstractTableModel.__init__(self, parent=parent)
+        self._load(df)
+
+    def set_dataframe(self, df):
+        """Replace the displayed DataFrame, resetting attached views."""
+        self.beginResetModel()
+        self._load(df)
+        self.endResetModel()
+
+    def _load(self, df):
+        """Take a DataFrame's (or array's) values, headers and shape for the Qt accessors."""
         self._df = df
+        # Qt asks for cells, headers and counts on every repaint; read them from plain arrays/lists, not iloc
+        if isinstance(df, np.ndarray):
+            if df.ndim > 2:
+                raise ValueError('PandasModel expects 1D or 2D data, got %sD' % df.ndim)
+            elif df.ndim == 1:
+                self._values = df.reshape(-1, 1)
+            elif df.ndim == 0:
+                self._values = df.reshape(1, 1)
+            else:
+                self._values = df
+            self._columns = list(range(self._values.shape[1]))
+            self._index = [str(label) for label in range(self._values.shape[0])]
+        else:
+            # object keeps each column's own scalars (ints stay ints, Timestamps print as Timestamps)
+            self._values = df.to_numpy(dtype=object)
+            self._columns = df.columns.tolist()
+            self._index = [str(label) for label in df.index.tolist()]
+        self._n_rows = len(self._index)
+        self._n_cols = len(self._columns)
+        # Formatted cells by (row, column), filled as Qt asks for them during painting
+        self._display = dict()
 
     def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
         """Provide header labels for rows and columns.
@@ -31,16 +66,16 @@ class PandasModel(QtCore.QAbstractTableModel):
         if role == QtCore.Qt.DisplayRole:
             if orientation == QtCore.Qt.Horizontal:
                 try:
-                    return self._df.columns.tolist()[section]
+                    return self._columns[section]
                 except (IndexError, ):
                     return QtCore.QVariant()
             elif orientation == QtCore.Qt.Vertical:
                 try:
-                    return str(self._df.index.tolist()[section])
+                    return self._index[section]
                 except (IndexError, ):
                     return QtCore.QVariant()
         elif role == QtCore.Qt.TextAlignmentRole:
-            return QtCore.QVariant(QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter)
+            return _HEADER_ALIGNMENT
         elif role == QtCore.Qt.SizeHintRole:
             pass
         return QtCore.QVariant()
@@ -51,22 +86,26 @@ class PandasModel(QtCore.QAbstractTableModel):
         Formats numeric values to 5 decimal places for readability.
         """
         if role == QtCore.Qt.DisplayRole:
-            cell_value = self._df.iloc[index.row(), index.column()]
-            # Check for numeric types (numpy and python floats)
-            if isinstance(cell_value, (float, np.floating)):
-                cell_value = np.around(cell_value, 5)
-            return QtCore.QVariant(str(cell_value))
+            key = (index.row(), index.column())
+            text = self._display.get(key)
+            if text is None:
+                cell_value = self._values[key]
+                # Check for numeric types (numpy and python floats)
+                if isinstance(cell_value, (float, np.floating)):
+                    cell_value = round(float(cell_value), 5)
+                text = self._display[key] = QtCore.QVariant(str(cell_value))
+            return text
 
         elif role == QtCore.Qt.TextAlignmentRole:
-            return QtCore.QVariant(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+            return _CELL_ALIGNMENT
 
         return QtCore.QVariant()
 
     def rowCount(self, parent=QtCore.QModelIndex()):
         """Return the number of rows in the DataFrame."""
-        return len(self._df.index)
+        return self._n_rows
 
     def columnCount(self, parent=QtCore.QModelIndex()):
         """Return the number of columns in the DataFrame."""
-        return len(self._df.columns)
+        return self._n_cols
 
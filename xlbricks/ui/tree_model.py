@@ -4,7 +4,6 @@
     Description: Qt tree model for an arbitrary dictionary; used by Explorer.
 """
 
-import pandas as pd
 from xlbricks.ui.node import Node
 from PyQt5 import QtCore
 
@@ -22,6 +21,15 @@ class DictionaryTreeModel(QtCore.QAbstractItemModel):
         super(DictionaryTreeModel, self).__init__(parent)
         self._rootNode = root
 
+    def reset_from_dict(self, datadict):
+        """Rebuild the tree from a nested dictionary in place.
+        
+        Keeps the model object (and the view's header and settings) instead of replacing it.
+        """
+        self.beginResetModel()
+        self._rootNode = node_structure_from_dict(datadict)
+        self.endResetModel()
+
     def rowCount(self, parent):
         """Return the number of children for a given parent node."""
         if not parent.isValid():
@@ -29,7 +37,7 @@ class DictionaryTreeModel(QtCore.QAbstractItemModel):
         else:
             parent_node = parent.internalPointer()
 
-        return parent_node.child_count()
+        return len(parent_node.children)
 
     def columnCount(self, parent):
         """Return the number of columns (always 1 for tree display)."""
@@ -58,13 +66,10 @@ class DictionaryTreeModel(QtCore.QAbstractItemModel):
 
     def index(self, row, column, parent):
         """Create an index for accessing a specific node in the tree."""
-        parent_node = self.get_node(parent)
-        child_item = parent_node.child(row)
-
-        if child_item:
-            return self.createIndex(row, column, child_item)
-        else:
-            return QtCore.QModelIndex()
+        children = self.get_node(parent).children
+        if 0 <= row < len(children):
+            return self.createIndex(row, column, children[row])
+        return QtCore.QModelIndex()
 
     def get_node(self, index):
         """Retrieve the Node object from a model index.
@@ -78,24 +83,21 @@ class DictionaryTreeModel(QtCore.QAbstractItemModel):
         return self._rootNode
 
 
-def node_structure_from_dict(datadict, parent=None, root_node=None):
+def node_structure_from_dict(datadict, parent=None):
     """Convert a nested dictionary into a tree of Node objects.
     
-    Recursively builds the node hierarchy for tree model display.
+    Builds the node hierarchy for tree model display with an explicit stack, so deep nesting cannot hit the recursion limit.
     """
-    if not parent:
-        root_node = Node('Root')
-        parent = root_node
-
-    for name, data in datadict.items():
-        node = Node(name, parent)
-        node.name = str(name)
-        if isinstance(data, dict):
-            node_structure_from_dict(data, node, root_node)
-        elif isinstance(data, pd.DataFrame):
-            node.value = data.head(min(25, len(data)))
-        else:
-            node.value = data
+    root_node = parent if parent is not None else Node('Root')
+    stack = [(root_node, datadict)]
+    while stack:
+        parent_node, level = stack.pop()
+        for name, data in level.items():
+            node = Node(str(name), parent_node)
+            if isinstance(data, dict):
+                stack.append((node, data))
+            else:
+                # DataFrames are kept whole; the explorer truncates them when one is displayed
+                node.value = data
 
     return root_node
-
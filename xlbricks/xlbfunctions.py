@@ -6,45 +6,197 @@
 """
 
 import sys
-import inspect
+import time
+import uuid
 import os.path as osp
 import numpy as np
 import xlwings as xw
-from datetime import datetime
-from functools import wraps
+from xlwings.conversion.numpy_conv import NumpyArrayConverter
+from datetime import date, datetime, timedelta
+from functools import wraps, lru_cache
 import xlbricks.libs.xlfunctions as xl
 from xlbricks.libs.utility_functions import XLUtils
-
-from PyQt5.QtGui import QIcon
-from PyQt5.QtWidgets import QApplication
-from xlbricks.ui.explorer import Explorer
-from xlbricks.ui.tree_model import DictionaryTreeModel, node_structure_from_dict
-from xlbricks.ui.config_editor import show_config_editor
 from xlbricks.libs.xlbricks_frontstack import XLBricksFrontStack
 from xlbricks.libs.validation import (
     _ERROR_PREFIX,
-    _is_missing,
-    _check_required,
     _check_array_2d,
+    _validate,
+    _REQUIRED,
+    _ARRAY_2D,
 )
 
+# xlfunctions entry points bound once, so UDF calls skip the module attribute lookup
+_xlbrick_create = xl.xlbrick_create
+_xlbricks_create = xl.xlbricks_create
+_xlbricks_create_pairs = xl.xlbricks_create_pairs
+_array_create = xl.array_create
+_list_create = xl.list_create
+_table_create = xl.table_create
+_grid_create = xl.grid_create
+_lookup_element = xl.lookup_element
+_flatten_element = xl.flatten_element
+_assign_alias = xl.assign_alias
+_create_function_objects = xl.create_function_objects
+_create_context_object = xl.create_context_object
+_run_function = xl.run_function
+_run_quantlib_function = xl.run_quantlib_function
+_merge_elements = xl.merge_elements
+_clear_bricks_front = xl.clear_bricks_front
+
+# Identifies this Python server; the VBA result cache (generate_vba) is emptied when it changes
+_SESSION = uuid.uuid4().hex
+
+# Shared QApplication for the explorer and config editor windows (see _qapp)
+_QAPP = None
+
+# (today's date, timestamp of the following midnight) for xlb_today
+_TODAY_CACHE = (None, 0.0)
+_now = time.time
+_today = date.today
+
+# Error strings returned by _return_errors, keyed by (exception type name, message); oldest dropped when full
+_ERROR_CACHE = dict()
+_ERROR_CACHE_SIZE = 256
+
+# Results of _xlb_cached UDFs keyed by (function name, arguments); emptied when full
+_XLB_CACHE = dict()
+_XLB_CACHE_SIZE = 1024
+# alias -> (latest 'alias:counter' reference seen, keys of _XLB_CACHE built from it)
+_XLB_CACHE_ALIASES = dict()
+
 
 def _return_errors(f):
     """Decorator: catch exceptions and return a #ERROR: message string for Excel.
-    Preserves the wrapped function's signature so xlwings UDF inspection still works."""
+    functools.wraps sets __wrapped__, which inspect.signature (used by xlwings UDF inspection) follows."""
+    prefix = _ERROR_PREFIX
+
     @wraps(f)
     def wrapper(*args, **kwargs):
         try:
             return f(*args, **kwargs)
         except Exception as e:
-            return _ERROR_PREFIX + '%s: %s' % (type(e).__name__, str(e))
-    wrapper.__signature__ = inspect.signature(f)
+            key = (type(e).__name__, str(e))
+            message = _ERROR_CACHE.get(key)
+            if message is None:
+                if len(_ERROR_CACHE) >= _ERROR_CACHE_SIZE:
+                    del _ERROR_CACHE[next(iter(_ERROR_CACHE))]
+                message = _ERROR_CACHE[key] = sys.intern(f'{prefix}{key[0]}: {key[1]}')
+            return message
     return wrapper
 
 
+class _Array2DConverter(NumpyArrayConverter):
+    """np.array argument converter that reuses its read pipeline.
+    
+    xlwings asks the converter for a new pipeline on every UDF call; the stages only hold the options
+    they were built from, so one pipeline per distinct set of options is built and kept.
+    """
+
+    # Reading stays np.array(value): pywin32 has already unpacked the COM SAFEARRAY into tuples before the UDF
+    # server sees it, so there is no raw buffer for np.frombuffer to wrap.
+    _readers = dict()
+
+    @classmethod
+    def reader(cls, options):
+        key = frozenset(options.items())
+        pipeline = cls._readers.get(key)
+        if pipeline is None:
+            pipeline = cls._readers[key] = super(_Array2DConverter, cls).reader(options)
+        return pipeline
+
+
+def _array2d_args(*names):
+    """Decorator: mark each named argument for conversion to a 2D numpy array (np.array with ndim=2)."""
+    def deco(f):
+        for name in reversed(names):
+            f = xw.arg(name, _Array2DConverter, ndim=2)(f)
+        return f
+    return deco
+
+
+def xlb_cached(f):
+    """Decorator: mark a UDF whose VBA wrapper may cache results (see generate_vba.py); f is unchanged."""
+    f.__xlb_cached__ = True
+    return f
+
+
+def _xlb_cached(f):
+    """Decorator: memoize a UDF whose range arguments are all brick references.
+    
+    A reference string carries the brick's counter, so a rebuilt brick gets a new key and the results
+    cached for its older counter are dropped; calls that pass data ranges go straight through.
+    xlb_clear_bricks_front empties the cache.
+    """
+    name = f.__name__
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        key, references = _xlb_cache_key(name, args, kwargs)
+        if key is None:
+            return f(*args, **kwargs)
+        result = _XLB_CACHE.get(key, _XLB_CACHE)
+        if result is _XLB_CACHE:
+            _xlb_cache_evict(references)
+            result = f(*args, **kwargs)
+            if not (isinstance(result, str) and result.startswith(_ERROR_PREFIX)):
+                if len(_XLB_CACHE) >= _XLB_CACHE_SIZE:
+                    _xlb_cache_clear()
+                _XLB_CACHE[key] = result
+                for alias, reference in references:
+                    _XLB_CACHE_ALIASES.setdefault(alias, (reference, set()))[1].add(key)
+        return result
+    return wrapper
+
+
+def _xlb_cache_key(name, args, kwargs):
+    """Build the _xlb_cached key for a call and its (alias, reference) pairs.
+    
+    Returns (None, None) if an argument cannot be keyed.
+    """
+    parts = list(args)
+    for kw in sorted(kwargs):
+        parts += (kw, kwargs[kw])
+    key = [name]
+    references = list()
+    for arg in parts:
+        if isinstance(arg, np.ndarray):
+            alias = XLUtils._parse_front(arg)
+            if alias is None:
+                return None, None
+            arg = arg[0, 0]
+            references.append((alias, arg))
+        try:
+            hash(arg)
+        except TypeError:
+            return None, None
+        key.append(arg)
+    return tuple(key), references
+
+
+def _xlb_cache_evict(references):
+    """Drop the results cached for an older counter of each referenced alias."""
+    for alias, reference in references:
+        entry = _XLB_CACHE_ALIASES.get(alias)
+        if entry is None or entry[0] != reference:
+            if entry is not None:
+                for key in entry[1]:
+                    _XLB_CACHE.pop(key, None)
+            _XLB_CACHE_ALIASES[alias] = (reference, set())
+
+
+def _xlb_cache_clear():
+    """Empty the _xlb_cached results and their alias index."""
+    _XLB_CACHE.clear()
+    _XLB_CACHE_ALIASES.clear()
+
+
+# Brick arguments of xlb_bricks; the matching key_i arguments need no conversion options
+_XLB_BRICKS_ARGS = tuple('brick_%d' % idx for idx in range(1, 9))
+
+
 @xw.func
 @xw.arg('key')
-@xw.arg('data', np.array, ndim=2)
+@_array2d_args('data')
 @xw.arg('xlapp', vba='Application')
 @_return_errors
 def xlb_brick(key, data, persist=True, xlapp=None):
@@ -52,29 +204,14 @@ def xlb_brick(key, data, persist=True, xlapp=None):
     
     Returns a reference string (e.g., 'mykey:1') that can be used in other functions.
     """
-    err = _check_required('key', key) or _check_array_2d('data', data)
+    err = _validate(('key', _REQUIRED, key), ('data', _ARRAY_2D, data))
     if err:
         return err
-    return xl.xlbrick_create(key, data, persist, xlapp)
+    return _xlbrick_create(key, data, persist, xlapp)
 
 
 @xw.func
-@xw.arg('key_1')
-@xw.arg('brick_1', np.array, ndim=2)
-@xw.arg('key_2')
-@xw.arg('brick_2', np.array, ndim=2)
-@xw.arg('key_3')
-@xw.arg('brick_3', np.array, ndim=2)
-@xw.arg('key_4')
-@xw.arg('brick_4', np.array, ndim=2)
-@xw.arg('key_5')
-@xw.arg('brick_5', np.array, ndim=2)
-@xw.arg('key_6')
-@xw.arg('brick_6', np.array, ndim=2)
-@xw.arg('key_7')
-@xw.arg('brick_7', np.array, ndim=2)
-@xw.arg('key_8')
-@xw.arg('brick_8', np.array, ndim=2)
+@_array2d_args(*_XLB_BRICKS_ARGS)
 @xw.arg('xlapp', vba='Application')
 @_return_errors
 def xlb_bricks(key_1, brick_1, key_2=None, brick_2=None, key_3=None, brick_3=None,
@@ -84,15 +221,30 @@ def xlb_bricks(key_1, brick_1, key_2=None, brick_2=None, key_3=None, brick_3=Non
     
     Returns a reference to the collection of bricks.
     """
-    err = _check_required('key_1', key_1) or _check_array_2d('brick_1', brick_1)
+    err = _validate(('key_1', _REQUIRED, key_1), ('brick_1', _ARRAY_2D, brick_1))
     if err:
         return err
-    return xl.xlbricks_create(key_1, brick_1, key_2, brick_2, key_3, brick_3, key_4, brick_4,
+    return _xlbricks_create(key_1, brick_1, key_2, brick_2, key_3, brick_3, key_4, brick_4,
                               key_5, brick_5, key_6, brick_6, key_7, brick_7, key_8, brick_8, persist, xlapp)
 
 
 @xw.func
-@xw.arg('data', np.array, ndim=2)
+@_array2d_args('pairs')
+@xw.arg('xlapp', vba='Application')
+@_return_errors
+def xlb_bricks_v2(pairs, persist=True, xlapp=None):
+    """Create multiple named bricks from a two-column range of keys and bricks.
+    
+    Reads any number of pairs in one range instead of up to 8 separate arguments.
+    """
+    err = _check_array_2d('pairs', pairs)
+    if err:
+        return err
+    return _xlbricks_create_pairs(pairs, persist, xlapp)
+
+
+@xw.func
+@_array2d_args('data')
 @xw.arg('xlapp', vba='Application')
 @_return_errors
 def xlb_array(data, persist=True, xlapp=None):
@@ -103,11 +255,11 @@ def xlb_array(data, persist=True, xlapp=None):
     err = _check_array_2d('data', data)
     if err:
         return err
-    return xl.array_create(data, persist, xlapp)
+    return _array_create(data, persist, xlapp)
 
 
 @xw.func
-@xw.arg('data', np.array, ndim=2)
+@_array2d_args('data')
 @xw.arg('xlapp', vba='Application')
 @_return_errors
 def xlb_list(data, persist=True, xlapp=None):
@@ -118,13 +270,11 @@ def xlb_list(data, persist=True, xlapp=None):
     err = _check_array_2d('data', data)
     if err:
         return err
-    return xl.list_create(data, persist, xlapp)
+    return _list_create(data, persist, xlapp)
 
 
 @xw.func
-@xw.arg('data', np.array, ndim=2)
-@xw.arg('index', np.array, ndim=2)
-@xw.arg('columns', np.array, ndim=2)
+@_array2d_args('data', 'index', 'columns')
 @xw.arg('xlapp', vba='Application')
 @_return_errors
 def xlb_table(data, columns=None, index=None, persist=True, xlapp=None):
@@ -135,11 +285,11 @@ def xlb_table(data, columns=None, index=None, persist=True, xlapp=None):
     err = _check_array_2d('data', data)
     if err:
         return err
-    return xl.table_create(data, columns, index, persist, xlapp)
+    return _table_create(data, columns, index, persist, xlapp)
 
 
 @xw.func
-@xw.arg('data', np.array, ndim=2)
+@_array2d_args('data')
 @xw.arg('xlapp', vba='Application')
 @_return_errors
 def xlb_grid(data, persist=True, xlapp=None):
@@ -150,11 +300,11 @@ def xlb_grid(data, persist=True, xlapp=None):
     err = _check_array_2d('data', data)
     if err:
         return err
-    return xl.grid_create(data, persist, xlapp)
+    return _grid_create(data, persist, xlapp)
 
 
 @xw.func
-@xw.arg('bricks', np.array, ndim=2)
+@_array2d_args('bricks')
 @xw.arg('keys')
 @xw.arg('xlapp', vba='Application')
 @_return_errors
@@ -163,15 +313,17 @@ def xlb_lookup(bricks, keys=None, persist=True, xlapp=None):
     
     Use forward slashes to navigate through nested brick structures.
     """
-    err = _check_array_2d('bricks', bricks) or _check_required('keys', keys)
+    err = _validate(('bricks', _ARRAY_2D, bricks), ('keys', _REQUIRED, keys))
     if err:
         return err
-    return xl.lookup_element(bricks, keys, persist, xlapp)
+    return _lookup_element(bricks, keys, persist, xlapp)
 
 
 @xw.func
-@xw.arg('brick', np.array, ndim=2)
+@xlb_cached
+@_array2d_args('brick')
 @_return_errors
+@_xlb_cached
 def xlb_flatten(brick):
     """Extract the raw data from a brick reference.
     
@@ -180,25 +332,25 @@ def xlb_flatten(brick):
     err = _check_array_2d('brick', brick)
     if err:
         return err
-    return xl.flatten_element(brick)
+    return _flatten_element(brick)
 
 
 @xw.func
-@xw.arg('brick', np.array, ndim=2)
+@_array2d_args('brick')
 @_return_errors
 def xlb_alias(brick, alias):
     """Assign a custom name (alias) to an existing brick.
     
     Makes bricks easier to reference with memorable names instead of cell addresses.
     """
-    err = _check_array_2d('brick', brick) or _check_required('alias', alias)
+    err = _validate(('brick', _ARRAY_2D, brick), ('alias', _REQUIRED, alias))
     if err:
         return err
-    return xl.assign_alias(brick, alias)
+    return _assign_alias(brick, alias)
 
 
 @xw.func
-@xw.arg('functions', np.array, ndim=2)
+@_array2d_args('functions')
 @xw.arg('xlapp', vba='Application')
 @_return_errors
 def xlb_create_function(functions, persist=True, xlapp=None):
@@ -209,13 +361,13 @@ def xlb_create_function(functions, persist=True, xlapp=None):
     err = _check_array_2d('functions', functions)
     if err:
         return err
-    return xl.create_function_objects(functions, persist, xlapp)
+    return _create_function_objects(functions, persist, xlapp)
 
 
 @xw.func
 @xw.arg('context_name')
 @xw.arg('context_path')
-@xw.arg('args', np.array, ndim=2)
+@_array2d_args('args')
 @xw.arg('xlapp', vba='Application')
 @_return_errors
 def xlb_create_context(context_name, context_path, args=None, persist=True, xlapp=None):
@@ -223,16 +375,15 @@ def xlb_create_context(context_name, context_path, args=None, persist=True, xlap
     
     Useful for instantiating objects like QuantLib contexts with optional arguments.
     """
-    err = _check_required('context_name', context_name) or _check_required('context_path', context_path)
+    err = _validate(('context_name', _REQUIRED, context_name), ('context_path', _REQUIRED, context_path))
     if err:
         return err
-    return xl.create_context_object(context_name, context_path, args, persist, xlapp)
+    return _create_context_object(context_name, context_path, args, persist, xlapp)
 
 
 @xw.func
-@xw.arg('function_brick', np.array, ndim=2)
+@_array2d_args('function_brick', 'args')
 @xw.arg('function_name')
-@xw.arg('args', np.array, ndim=2)
 @xw.arg('xlapp', vba='Application')
 @_return_errors
 def xlb_run_function(function_brick, function_name, args=None, persist=True, xlapp=None):
@@ -240,16 +391,15 @@ def xlb_run_function(function_brick, function_name, args=None, persist=True, xla
     
     Pass arguments as key-value pairs in a range.
     """
-    err = _check_array_2d('function_brick', function_brick) or _check_required('function_name', function_name)
+    err = _validate(('function_brick', _ARRAY_2D, function_brick), ('function_name', _REQUIRED, function_name))
     if err:
         return err
-    return xl.run_function(function_brick, function_name, args, persist, xlapp)
+    return _run_function(function_brick, function_name, args, persist, xlapp)
 
 
 @xw.func
-@xw.arg('quantlib_object', np.array, ndim=2)
+@_array2d_args('quantlib_object', 'args')
 @xw.arg('function_name')
-@xw.arg('args', np.array, ndim=2)
 @xw.arg('xl_app', vba='Application')
 @_return_errors
 def xlb_run_quantlib_function(quantlib_object, function_name, args=None, persist=True, xl_app=None):
@@ -257,18 +407,14 @@ def xlb_run_quantlib_function(quantlib_object, function_name, args=None, persist
     
     Enables financial calculations using QuantLib directly from Excel.
     """
-    err = _check_array_2d('quantlib_object', quantlib_object) or _check_required('function_name', function_name)
+    err = _validate(('quantlib_object', _ARRAY_2D, quantlib_object), ('function_name', _REQUIRED, function_name))
     if err:
         return err
-    return xl.run_quantlib_function(quantlib_object, function_name, args, persist, xl_app)
+    return _run_quantlib_function(quantlib_object, function_name, args, persist, xl_app)
 
 
 @xw.func
-@xw.arg('brick_1', np.array, ndim=2)
-@xw.arg('brick_2', np.array, ndim=2)
-@xw.arg('brick_3', np.array, ndim=2)
-@xw.arg('brick_4', np.array, ndim=2)
-@xw.arg('brick_5', np.array, ndim=2)
+@_array2d_args('brick_1', 'brick_2', 'brick_3', 'brick_4', 'brick_5')
 @xw.arg('xlapp', vba='Application')
 @_return_errors
 def xlb_merge(brick_1, brick_2, brick_3=None, brick_4=None, brick_5=None, persist=True, xlapp=None):
@@ -276,30 +422,44 @@ def xlb_merge(brick_1, brick_2, brick_3=None, brick_4=None, brick_5=None, persis
     
     All keys from the input bricks are merged into one unified brick.
     """
-    err = _check_array_2d('brick_1', brick_1) or _check_array_2d('brick_2', brick_2)
+    err = _validate(('brick_1', _ARRAY_2D, brick_1), ('brick_2', _ARRAY_2D, brick_2))
     if err:
         return err
-    return xl.merge_elements(brick_1, brick_2, brick_3, brick_4, brick_5, persist, xlapp)
+    return _merge_elements(brick_1, brick_2, brick_3, brick_4, brick_5, persist, xlapp)
 
 
 @xw.func
-@_return_errors
 def xlb_today():
     """Return today's date.
     
     Simple utility function for getting the current date in Excel.
     """
-    return datetime.today()
+    global _TODAY_CACHE
+    today, expires = _TODAY_CACHE
+    if _now() >= expires:
+        today = _today()
+        expires = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+        _TODAY_CACHE = (today, expires)
+    return today
 
 
 @xw.func
-@_return_errors
 def xlb_clear_bricks_front():
     """Clear all bricks from memory.
     
     Use this to reset the brick storage and free up memory.
     """
-    return xl.clear_bricks_front()
+    _xlb_cache_clear()
+    return _clear_bricks_front()
+
+
+@xw.func
+def xlb_session():
+    """Return the token of this Python server session.
+    
+    The patched VBA module compares it to drop results cached before a server restart.
+    """
+    return _SESSION
 
 
 @xw.func
@@ -309,49 +469,71 @@ def xlb_open_bricks_explorer():
     
     Browse the brick hierarchy and view data in a tree and table interface.
     """
-    explorer_app = QApplication(sys.argv)
+    # Qt and the UI modules are only loaded when a window is opened, keeping them off the UDF import path
+    from PyQt5.QtGui import QIcon
+    from xlbricks.ui.explorer import Explorer
+    from xlbricks.ui.tree_model import DictionaryTreeModel, node_structure_from_dict
+    explorer_app = _qapp()
     img_path = _get_image_path('stars.png')
     explorer_app.setWindowIcon(QIcon(img_path))
     model = DictionaryTreeModel(node_structure_from_dict(XLBricksFrontStack().to_dict()))
     wizard = Explorer(model)
     wizard.display()
-    sys.exit(explorer_app.exec_())
+    explorer_app.exec_()
 
 
 @xw.func
-@xw.arg('data', np.array, ndim=2)
+@_array2d_args('data')
 @_return_errors
 def xlb_open_brick_explorer(data):
     """Open a visual explorer window for a specific brick.
     
     View the structure and contents of a single brick in detail.
     """
+    from PyQt5.QtGui import QIcon
+    from xlbricks.ui.explorer import Explorer
+    from xlbricks.ui.tree_model import DictionaryTreeModel, node_structure_from_dict
     err = _check_array_2d('data', data)
     if err:
         return err
-    if XLUtils.is_bricks_front_name(data):
-        key = ''.join(data[0, 0].split(':')[:-1])
+    key = XLUtils._parse_front(data)
+    if key is not None:
         element = XLUtils.get_bricks(data)
-        explorer_app = QApplication(sys.argv)
+        explorer_app = _qapp()
         img_path = _get_image_path('stars.png')
         explorer_app.setWindowIcon(QIcon(img_path))
         model = DictionaryTreeModel(node_structure_from_dict({key: element.to_dict()}))
         wizard = Explorer(model)
         wizard.display_one_element()
-        sys.exit(explorer_app.exec_())
+        explorer_app.exec_()
 
 
 @xw.func
 @_return_errors
 def xlb_open_config_editor():
     """Open the XLBricks config editor UI (same as XLBricks Wizard, from Excel)."""
-    config_app = QApplication(sys.argv)
+    from PyQt5.QtGui import QIcon
+    from xlbricks.ui.config_editor import show_config_editor
+    config_app = _qapp()
     img_path = _get_image_path('settings.png')
     config_app.setWindowIcon(QIcon(img_path))
     show_config_editor()
-    sys.exit(0)
 
 
+def _qapp():
+    """Return the process QApplication, creating it on first use.
+    
+    Qt allows one QApplication per process, so it is reused across UI opens; the event loop
+    returns when the window closes instead of exiting, which keeps the UDF server running.
+    """
+    global _QAPP
+    if _QAPP is None:
+        from PyQt5.QtWidgets import QApplication
+        _QAPP = QApplication.instance() or QApplication([])
+    return _QAPP
+
+
+@lru_cache(maxsize=1)
 def _get_package_dir():
     """Return the absolute path to the xlbricks package directory (where xlbfunctions.py lives)."""
     this_file = getattr(sys.modules[__name__], '__file__', None)
@@ -360,6 +542,7 @@ def _get_package_dir():
     return osp.abspath(osp.dirname(this_file))
 
 
+@lru_cache(maxsize=16)
 def _get_image_path(name: str):
     """Return path to an icon from the imgs folder. Works when run from Excel (uses absolute path)."""
     pkg_dir = _get_package_dir()